@@ -11,7 +11,7 @@ from typing import Optional, Sequence
 from .database import PoetryDatabase
 from .ingest import build_database
 from .models import SearchResult
-from .phonetics import Pronunciation, strip_stress
+from .phonetics import strip_stress
 from .rhymes import RhymeAssistant
 from .search import SearchEngine, SearchOptions
 from .syllables import syllabify
@@ -184,33 +184,32 @@ def main(argv: Optional[list[str]] = None) -> None:
         results = engine.search(options)
         _print_results(results)
     elif args.command == "word":
-        assistant = RhymeAssistant(db)
-        pronunciations = assistant.pronunciations_for_word(args.word)
-        if not pronunciations:
+        word_rows = db.pronunciations_for_word(args.word)
+        if not word_rows:
             print(f"No pronunciations found for {args.word}")
         else:
             print(f"Pronunciations for {args.word}:")
-            for pron in pronunciations:
-                syllable_description = _describe_syllables(pron)
+            # Rows already carry the derived columns, so no Pronunciation
+            # objects need to be rebuilt just for display.
+            for row in word_rows:
+                syllable_description = _describe_syllables(row["pronunciation"])
                 print(
-                    f"  - {pron.text} (syllables={pron.syllable_count}, stress={pron.stress_pattern})"
+                    f"  - {row['pronunciation']} (syllables={row['syllable_count']}, stress={row['stress_pattern']})"
                 )
                 print(f"    syllabified: {syllable_description}")
             # attach definitions
-            word_rows = db.pronunciations_for_word(args.word)
-            if word_rows:
-                word_id = word_rows[0]["word_id"]
-                definitions = db.load_definitions([word_id]).get(word_id, [])
-                if definitions:
-                    print("Definitions:")
-                    for definition in definitions:
-                        synonyms = ", ".join(definition.synonyms)
-                        base = f"  - ({definition.part_of_speech}) {definition.definition}"
-                        if synonyms:
-                            base += f" | synonyms: {synonyms}"
-                        if definition.example:
-                            base += f" | example: {definition.example}"
-                        print(base)
+            word_id = word_rows[0]["word_id"]
+            definitions = db.load_definitions([word_id]).get(word_id, [])
+            if definitions:
+                print("Definitions:")
+                for definition in definitions:
+                    synonyms = ", ".join(definition.synonyms)
+                    base = f"  - ({definition.part_of_speech}) {definition.definition}"
+                    if synonyms:
+                        base += f" | synonyms: {synonyms}"
+                    if definition.example:
+                        base += f" | example: {definition.example}"
+                    print(base)
     elif args.command == "rhymes-with":
         assistant = RhymeAssistant(db)
         limit = None if getattr(args, "all", False) else args.limit
@@ -288,8 +287,8 @@ def _format_cluster(cluster: Sequence[str]) -> str:
     return f"({' '.join(display_tokens)})"
 
 
-def _describe_syllables(pronunciation: Pronunciation) -> str:
-    syllables = syllabify(pronunciation.phonemes)
+def _describe_syllables(pronunciation: Sequence[str] | str) -> str:
+    syllables = syllabify(pronunciation)
     parts: list[str] = []
     for syllable in syllables:
         onset = _format_cluster(syllable.onset)
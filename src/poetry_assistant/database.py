@@ -1,12 +1,18 @@
 """SQLite persistence for the poetry assistant."""
 from __future__ import annotations
 
+import logging
 import sqlite3
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from .models import Definition
-from .phonetics import Pronunciation, to_pronunciation
+from .phonetics import Pronunciation, strip_stress, to_pronunciation
+
+LOGGER = logging.getLogger(__name__)
 
 SCHEMA = """
 PRAGMA foreign_keys = ON;
@@ -30,6 +36,7 @@ CREATE TABLE IF NOT EXISTS pronunciations (
     rhyme_key_3 TEXT,
     rhyme_key_4 TEXT,
     phonemes_no_stress TEXT,
+    perfect_rhyme_key TEXT,
     FOREIGN KEY(word_id) REFERENCES words(id) ON DELETE CASCADE,
     UNIQUE(word_id, pronunciation)
 );
@@ -52,14 +59,121 @@ CREATE TABLE IF NOT EXISTS synonyms (
 );
 
 CREATE INDEX IF NOT EXISTS idx_pronunciations_word_id ON pronunciations(word_id);
-CREATE INDEX IF NOT EXISTS idx_pronunciations_rhyme1 ON pronunciations(rhyme_key_1);
-CREATE INDEX IF NOT EXISTS idx_pronunciations_rhyme2 ON pronunciations(rhyme_key_2);
-CREATE INDEX IF NOT EXISTS idx_pronunciations_rhyme3 ON pronunciations(rhyme_key_3);
-CREATE INDEX IF NOT EXISTS idx_pronunciations_rhyme4 ON pronunciations(rhyme_key_4);
 CREATE INDEX IF NOT EXISTS idx_definitions_word_id ON definitions(word_id);
+CREATE INDEX IF NOT EXISTS idx_definitions_pos ON definitions(part_of_speech, word_id);
 CREATE INDEX IF NOT EXISTS idx_synonyms_definition_id ON synonyms(definition_id);
 """
 
+# Kept separate from SCHEMA because FTS5 (and its trigram tokenizer) is an
+# optional SQLite feature; without it, lexical filters fall back to LIKE.
+FTS_SCHEMA = """
+-- Trigram full-text indexes let substring (LIKE '%text%') filters on
+-- definitions and synonyms use an index instead of scanning every row.
+CREATE VIRTUAL TABLE IF NOT EXISTS definitions_fts USING fts5(
+    definition, content='definitions', content_rowid='id', tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS synonyms_fts USING fts5(
+    synonym, content='synonyms', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS definitions_fts_insert AFTER INSERT ON definitions BEGIN
+    INSERT INTO definitions_fts(rowid, definition) VALUES (new.id, new.definition);
+END;
+CREATE TRIGGER IF NOT EXISTS definitions_fts_delete AFTER DELETE ON definitions BEGIN
+    INSERT INTO definitions_fts(definitions_fts, rowid, definition)
+    VALUES ('delete', old.id, old.definition);
+END;
+CREATE TRIGGER IF NOT EXISTS synonyms_fts_insert AFTER INSERT ON synonyms BEGIN
+    INSERT INTO synonyms_fts(rowid, synonym) VALUES (new.id, new.synonym);
+END;
+CREATE TRIGGER IF NOT EXISTS synonyms_fts_delete AFTER DELETE ON synonyms BEGIN
+    INSERT INTO synonyms_fts(synonyms_fts, rowid, synonym)
+    VALUES ('delete', old.id, old.synonym);
+END;
+"""
+
+# Number of trailing-syllable rhyme keys stored per pronunciation.
+MAX_PRECOMPUTED_RHYME_KEY = 4
+
+# Secondary indexes that bulk loads drop and rebuild afterwards, which is
+# much cheaper than maintaining them row by row during the load. Rhyme
+# lookups rank by syllable count first, so the key indexes carry it too and
+# SQLite only has to sort rows within each syllable count.
+_BULK_DEFERRED_INDEXES = {
+    **{
+        f"idx_pronunciations_rhyme{k}": (
+            f"CREATE INDEX IF NOT EXISTS idx_pronunciations_rhyme{k} "
+            f"ON pronunciations(rhyme_key_{k}, syllable_count DESC)"
+        )
+        for k in range(1, MAX_PRECOMPUTED_RHYME_KEY + 1)
+    },
+    "idx_pronunciations_perfect_rhyme": (
+        "CREATE INDEX IF NOT EXISTS idx_pronunciations_perfect_rhyme "
+        "ON pronunciations(perfect_rhyme_key, syllable_count DESC)"
+    ),
+}
+
+_FTS_TABLES = ("definitions_fts", "synonyms_fts")
+
+# Sequence columns that near-match searches compare against; each can be
+# served by an in-memory phoneme-bigram index.
+QGRAM_COLUMNS = frozenset(
+    {
+        "pronunciation",
+        "terminal_vowels",
+        "terminal_consonants",
+        "terminal_both",
+        *(f"rhyme_key_{k}" for k in range(1, MAX_PRECOMPUTED_RHYME_KEY + 1)),
+    }
+)
+
+# Columns whose distinct values can be listed for matching ahead of a scan.
+_DISTINCT_COLUMNS = QGRAM_COLUMNS | {"stress_pattern"}
+
+_PAGE_SIZE = 8192
+
+# Words per ``IN`` lookup, well under SQLite's bound-parameter limit.
+_LOOKUP_BATCH_SIZE = 500
+
+# Applied to every initialised connection: WAL lets readers proceed while a
+# writer is active, and NORMAL sync is durable enough in WAL mode.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -200000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Used while bulk loading into a live file. Staying in WAL keeps other
+# connections working and the file consistent; only the last commits can be
+# lost if the machine goes down.
+_BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Used only while filling a freshly created file, which can simply be rebuilt
+# after a crash. Leaving WAL needs exclusive access to the file.
+_FRESH_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Stored in ``PRAGMA user_version``; bump it alongside a step in
+# ``PoetryDatabase._migrate`` whenever stored data needs upgrading.
+SCHEMA_VERSION = 3
+
+_INSERT_PRONUNCIATION = """
+    INSERT INTO pronunciations (
+        word_id, pronunciation, syllable_count, stress_pattern,
+        terminal_vowels, terminal_consonants, terminal_both,
+        rhyme_key_1, rhyme_key_2, rhyme_key_3, rhyme_key_4,
+        phonemes_no_stress, perfect_rhyme_key
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(word_id, pronunciation) DO NOTHING
+"""
+
 
 class PoetryDatabase:
     """High level database manager."""
@@ -68,15 +182,119 @@ class PoetryDatabase:
         self.path = Path(path)
         self.conn = sqlite3.connect(self.path)
         self.conn.row_factory = sqlite3.Row
+        self._definition_buffer: List[Tuple] = []
+        self._synonym_buffer: List[List[str]] = []
+        self._fts_available: Optional[bool] = None
+        self._distinct_sequences: Dict[str, List[str]] = {}
+        self._qgram_indexes: Dict[str, Dict[Tuple[str, str], List[str]]] = {}
+        self._generation = 0
+        self._data_version: Optional[int] = None
 
     def close(self) -> None:
+        self.flush_definitions()
         self.conn.close()
 
     def initialize(self) -> None:
         """Create schema if it does not already exist."""
 
+        version = int(self.conn.execute("PRAGMA user_version").fetchone()[0])
+        # Only takes effect for a brand new file, before any table exists.
+        self.conn.execute(f"PRAGMA page_size = {_PAGE_SIZE}")
         with self.conn:
             self.conn.executescript(SCHEMA)
+            try:
+                self.conn.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                LOGGER.debug("SQLite lacks FTS5 trigram support; using LIKE filters")
+            if version < SCHEMA_VERSION:
+                self._migrate(version)
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            # Created after migrating: older files may lack indexed columns.
+            for statement in _BULK_DEFERRED_INDEXES.values():
+                self.conn.execute(statement)
+        self._apply_pragmas(_CONNECTION_PRAGMAS)
+
+    def _has_fts(self) -> bool:
+        """Return ``True`` if the full-text index tables exist."""
+
+        if self._fts_available is None:
+            placeholders = ",".join("?" for _ in _FTS_TABLES)
+            count = self.conn.execute(
+                f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})", _FTS_TABLES
+            ).fetchone()[0]
+            self._fts_available = count == len(_FTS_TABLES)
+        return self._fts_available
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever stored rows may have changed.
+
+        Writes through this object bump it directly; ``PRAGMA data_version``
+        reveals commits made by other connections to the same file. Callers
+        compare it with a saved value to tell when cached results are stale.
+        """
+
+        self._check_data_version()
+        return self._generation
+
+    def _check_data_version(self) -> None:
+        """Drop cached data if another connection has committed since the last check."""
+
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self.invalidate_caches()
+
+    def invalidate_caches(self) -> None:
+        """Drop in-memory data derived from stored rows.
+
+        The write helpers call this themselves; call it after modifying the
+        database directly through :attr:`conn`.
+        """
+
+        self._generation += 1
+        self._distinct_sequences.clear()
+        self._qgram_indexes.clear()
+
+    def _apply_pragmas(self, pragmas: Iterable[str]) -> None:
+        for pragma in pragmas:
+            self.conn.execute(pragma)
+
+    @contextmanager
+    def _bulk_load(self, fresh: bool = False) -> Iterator[None]:
+        """Relax durability while loading data, restoring normal settings after."""
+
+        self._apply_pragmas(_FRESH_LOAD_PRAGMAS if fresh else _BULK_LOAD_PRAGMAS)
+        try:
+            yield
+        finally:
+            self._apply_pragmas(_CONNECTION_PRAGMAS)
+
+    def _migrate(self, version: int) -> None:
+        """Upgrade rows written under an older ``PRAGMA user_version``."""
+
+        if version < 1 and self._has_fts():
+            # Version 1 added the full-text indexes; index existing rows.
+            for table in _FTS_TABLES:
+                self.conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        if version < 2:
+            # Version 2 stores the perfect rhyme key alongside the rhyme keys.
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(pronunciations)")}
+            if "perfect_rhyme_key" not in columns:
+                self.conn.execute("ALTER TABLE pronunciations ADD COLUMN perfect_rhyme_key TEXT")
+            rows = self.conn.execute("SELECT id, pronunciation FROM pronunciations").fetchall()
+            self.conn.executemany(
+                "UPDATE pronunciations SET perfect_rhyme_key = ? WHERE id = ?",
+                (
+                    (to_pronunciation(row["pronunciation"]).perfect_rhyme_key(), row["id"])
+                    for row in rows
+                ),
+            )
+        if version < 3:
+            # Version 3 appends the syllable count to the rhyme-key indexes;
+            # drop the old definitions so ``initialize`` recreates them.
+            for name in _BULK_DEFERRED_INDEXES:
+                self.conn.execute(f"DROP INDEX IF EXISTS {name}")
 
     # ------------------------------------------------------------------
     # insert helpers
@@ -86,41 +304,80 @@ class PoetryDatabase:
 
         word = word.lower()
         with self.conn:
-            self.conn.execute("INSERT OR IGNORE INTO words(word) VALUES (?)", (word,))
+            cursor = self.conn.execute("INSERT OR IGNORE INTO words(word) VALUES (?)", (word,))
+        if cursor.rowcount:
+            self.invalidate_caches()
         row = self.conn.execute("SELECT id FROM words WHERE word = ?", (word,)).fetchone()
         if row is None:
             raise RuntimeError(f"Unable to persist word: {word}")
         return int(row[0])
 
     def add_pronunciation(self, word_id: int, pronunciation: Sequence[str] | str) -> None:
-        pron = to_pronunciation(pronunciation)
-        features = _pronunciation_features(pron)
-        values = (
-            word_id,
-            pron.text,
-            pron.syllable_count,
-            pron.stress_pattern,
-            features["terminal_vowels"],
-            features["terminal_consonants"],
-            features["terminal_both"],
-            features.get("rhyme_key_1"),
-            features.get("rhyme_key_2"),
-            features.get("rhyme_key_3"),
-            features.get("rhyme_key_4"),
-            features["phonemes_no_stress"],
-        )
+        values = (word_id, *pronunciation_record(pronunciation))
         with self.conn:
-            self.conn.execute(
-                """
-                INSERT OR IGNORE INTO pronunciations (
-                    word_id, pronunciation, syllable_count, stress_pattern,
-                    terminal_vowels, terminal_consonants, terminal_both,
-                    rhyme_key_1, rhyme_key_2, rhyme_key_3, rhyme_key_4,
-                    phonemes_no_stress
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                values,
+            self.conn.execute(_INSERT_PRONUNCIATION, values)
+        self.invalidate_caches()
+
+    def bulk_ingest(self, entries: Iterable[Tuple[str, Sequence[str]]]) -> Dict[str, int]:
+        """Insert ``(word, phonemes)`` pairs in a single transaction.
+
+        Returns a mapping of every ingested word to its database id.
+        """
+
+        return self.bulk_ingest_records(
+            (word, pronunciation_record(phonemes)) for word, phonemes in entries
+        )
+
+    def bulk_ingest_records(
+        self, records: Iterable[Tuple[str, Tuple]], *, fresh: bool = False
+    ) -> Dict[str, int]:
+        """Insert ``(word, pronunciation_record(...))`` pairs in a single transaction.
+
+        Accepting precomputed records lets callers derive the pronunciation
+        features elsewhere (for example in worker processes). Pass ``fresh``
+        only when filling a newly created file that no other connection has
+        open: the journal is then kept in memory, so a crash mid-load can
+        corrupt the file and it must be rebuilt.
+        """
+
+        pairs = [(word.lower(), record) for word, record in records]
+        with self._bulk_load(fresh), self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO words(word) VALUES (?)",
+                ((word,) for word, _ in pairs),
+            )
+            word_ids = self._word_ids(dict.fromkeys(word for word, _ in pairs))
+            # Rebuilding an index re-reads the whole table, which only beats
+            # row-by-row maintenance when the batch is at least as large as
+            # what is already stored.
+            stored = self.conn.execute("SELECT COUNT(*) FROM pronunciations").fetchone()[0]
+            defer_indexes = len(pairs) >= stored
+            if defer_indexes:
+                for name in _BULK_DEFERRED_INDEXES:
+                    self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+            self.conn.executemany(
+                _INSERT_PRONUNCIATION,
+                ((word_ids[word], *record) for word, record in pairs),
+            )
+            if defer_indexes:
+                for statement in _BULK_DEFERRED_INDEXES.values():
+                    self.conn.execute(statement)
+        self.invalidate_caches()
+        return {word: word_ids[word] for word, _ in pairs}
+
+    def _word_ids(self, words: Iterable[str]) -> Dict[str, int]:
+        """Return the ids of stored ``words``, looked up in batches."""
+
+        word_ids: Dict[str, int] = {}
+        pending = list(words)
+        for start in range(0, len(pending), _LOOKUP_BATCH_SIZE):
+            batch = pending[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            rows = self.conn.execute(
+                f"SELECT id, word FROM words WHERE word IN ({placeholders})", batch
             )
+            word_ids.update((row["word"], int(row["id"])) for row in rows)
+        return word_ids
 
     def add_definition(
         self,
@@ -133,21 +390,64 @@ class PoetryDatabase:
     ) -> None:
         """Persist a definition and optional synonyms."""
 
+        self.stage_definition(word_id, part_of_speech, definition, example, source, synonyms)
+        self.flush_definitions()
+
+    def stage_definition(
+        self,
+        word_id: int,
+        part_of_speech: Optional[str],
+        definition: str,
+        example: Optional[str] = None,
+        source: str = "wordnet",
+        synonyms: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Queue a definition for the next :meth:`flush_definitions` call."""
+
+        self._definition_buffer.append((word_id, part_of_speech, definition, example, source))
+        self._synonym_buffer.append([s.lower() for s in synonyms or () if s])
+
+    def flush_definitions(self) -> None:
+        """Write all staged definitions and synonyms in one transaction."""
+
+        if not self._definition_buffer:
+            return
+        definitions = self._definition_buffer
+        synonyms = self._synonym_buffer
+        self._definition_buffer = []
+        self._synonym_buffer = []
         with self.conn:
-            cur = self.conn.execute(
+            if not self.conn.in_transaction:
+                # Take the write lock before reading the id counter so no
+                # other writer can allocate the same ids in between.
+                self.conn.execute("BEGIN IMMEDIATE")
+            # executemany cannot report generated ids, so allocate them here,
+            # past every id AUTOINCREMENT has handed out, deleted ones included.
+            last_id = self.conn.execute(
+                """
+                SELECT MAX(
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'definitions'), 0),
+                    COALESCE((SELECT MAX(id) FROM definitions), 0)
+                )
+                """
+            ).fetchone()[0]
+            first_id = int(last_id) + 1
+            self.conn.executemany(
                 """
-                INSERT INTO definitions(word_id, part_of_speech, definition, example, source)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO definitions(id, word_id, part_of_speech, definition, example, source)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (word_id, part_of_speech, definition, example, source),
+                ((first_id + offset, *values) for offset, values in enumerate(definitions)),
             )
-            definition_id = int(cur.lastrowid)
-            if synonyms:
-                synonym_values = [(definition_id, s.lower()) for s in synonyms if s]
-                self.conn.executemany(
-                    "INSERT INTO synonyms(definition_id, synonym) VALUES (?, ?)",
-                    synonym_values,
-                )
+            self.conn.executemany(
+                "INSERT INTO synonyms(definition_id, synonym) VALUES (?, ?)",
+                (
+                    (first_id + offset, synonym)
+                    for offset, names in enumerate(synonyms)
+                    for synonym in names
+                ),
+            )
+        self.invalidate_caches()
 
     # ------------------------------------------------------------------
     # query helpers
@@ -175,24 +475,22 @@ class PoetryDatabase:
         """
         result: Dict[int, List[Definition]] = {}
         rows = self.conn.execute(query, tuple(word_ids))
-        current_defs: Dict[int, Definition] = {}
-        for row in rows:
-            definition_id = int(row["id"])
-            word_id = int(row["word_id"])
-            definition = current_defs.get(definition_id)
-            if definition is None:
-                definition = Definition(
-                    word_id=word_id,
-                    part_of_speech=row["part_of_speech"],
-                    definition=row["definition"],
-                    example=row["example"],
-                    source=row["source"],
-                )
-                current_defs[definition_id] = definition
-                result.setdefault(word_id, []).append(definition)
-            synonym = row["synonym"]
-            if synonym:
-                definition.synonyms.append(synonym)
+        # Rows are ordered by definition id, so each definition's synonym
+        # rows arrive contiguously.
+        for _, group in groupby(rows, key=itemgetter("id")):
+            first = next(group)
+            word_id = int(first["word_id"])
+            definition = Definition(
+                word_id=word_id,
+                part_of_speech=first["part_of_speech"],
+                definition=first["definition"],
+                example=first["example"],
+                source=first["source"],
+            )
+            if first["synonym"]:
+                definition.synonyms.append(first["synonym"])
+            definition.synonyms.extend(row["synonym"] for row in group if row["synonym"])
+            result.setdefault(word_id, []).append(definition)
         return result
 
     def iter_pronunciations(
@@ -200,45 +498,296 @@ class PoetryDatabase:
         part_of_speech: Optional[str] = None,
         definition_query: Optional[str] = None,
         synonym_query: Optional[str] = None,
-    ) -> Iterator[sqlite3.Row]:
-        """Iterate pronunciations optionally filtered by lexical information."""
+        *,
+        column: Optional[str] = None,
+        values: Optional[Sequence[str]] = None,
+    ) -> sqlite3.Cursor:
+        """Iterate pronunciations optionally filtered by lexical information.
+
+        When ``column`` and ``values`` are given only rows whose ``column``
+        is one of ``values`` are returned. The returned cursor's
+        ``description`` names the selected columns in row order.
+        """
+
+        conditions, params = self._lexical_conditions(part_of_speech, definition_query, synonym_query)
+        if column is not None and values is not None:
+            if column not in QGRAM_COLUMNS:
+                raise ValueError(f"Unsupported sequence column: {column}")
+            conditions.insert(0, f"pronunciations.{column} IN ({','.join('?' for _ in values)})")
+            params[:0] = values
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT pronunciations.*, words.word, words.id as word_id
+            FROM pronunciations
+            JOIN words ON words.id = pronunciations.word_id
+            {where_clause}
+            ORDER BY words.word, pronunciations.id
+        """
+        return self.conn.execute(query, tuple(params))
+
+    def distinct_sequences(self, column: str) -> List[str]:
+        """Return the distinct non-null values of a sequence ``column``.
+
+        ``column`` may also be ``stress_pattern``. Many pronunciations share
+        each value, so pattern matching over this list is much cheaper than
+        over every row. Cached until the next write from any connection.
+        """
 
+        if column not in _DISTINCT_COLUMNS:
+            raise ValueError(f"Unsupported sequence column: {column}")
+        self._check_data_version()
+        values = self._distinct_sequences.get(column)
+        if values is None:
+            query = f"SELECT DISTINCT {column} FROM pronunciations WHERE {column} IS NOT NULL"
+            values = [row[0] for row in self.conn.execute(query)]
+            self._distinct_sequences[column] = values
+        return values
+
+    def sequences_by_qgrams(
+        self, column: str, pattern_tokens: Sequence[str], min_shared: int
+    ) -> List[str]:
+        """Return distinct ``column`` values sharing phoneme bigrams with a pattern.
+
+        A value is returned when at least ``min_shared`` of the distinct
+        bigrams of ``pattern_tokens`` occur in it. The bigram index for
+        ``column`` is built on first use and dropped when pronunciations are
+        added, including by other connections.
+        """
+
+        index = self._qgram_index(column)
+        shared: Dict[str, int] = {}
+        for gram in set(zip(pattern_tokens, pattern_tokens[1:])):
+            for value in index.get(gram, ()):
+                shared[value] = shared.get(value, 0) + 1
+        return [value for value, count in shared.items() if count >= min_shared]
+
+    def _qgram_index(self, column: str) -> Dict[Tuple[str, str], List[str]]:
+        self._check_data_version()
+        index = self._qgram_indexes.get(column)
+        if index is None:
+            index = {}
+            for value in self.distinct_sequences(column):
+                phonemes = value.split()
+                for gram in set(zip(phonemes, phonemes[1:])):
+                    index.setdefault(gram, []).append(value)
+            self._qgram_indexes[column] = index
+        return index
+
+    def rhymes_by_key(
+        self,
+        key: str,
+        syllables: int,
+        *,
+        part_of_speech: Optional[str] = None,
+        definition_query: Optional[str] = None,
+        synonym_query: Optional[str] = None,
+        limit: Optional[int] = None,
+        exclude_word_ids: Optional[Iterable[int]] = None,
+    ) -> List[sqlite3.Row]:
+        """Return pronunciations whose ``rhyme_key_<syllables>`` equals ``key``.
+
+        The lookup uses the rhyme-key index. Rows come back ordered the way
+        search results are ranked: most syllables first, then alphabetically.
+        """
+
+        if not 1 <= syllables <= MAX_PRECOMPUTED_RHYME_KEY:
+            raise ValueError(f"Rhyme keys are only stored for 1-{MAX_PRECOMPUTED_RHYME_KEY} syllables")
+        return self._rows_by_key(
+            f"rhyme_key_{syllables}",
+            key,
+            part_of_speech=part_of_speech,
+            definition_query=definition_query,
+            synonym_query=synonym_query,
+            limit=limit,
+            exclude_word_ids=exclude_word_ids,
+        )
+
+    def perfect_rhymes_by_key(
+        self,
+        key: str,
+        *,
+        part_of_speech: Optional[str] = None,
+        limit: Optional[int] = None,
+        exclude_word_ids: Optional[Iterable[int]] = None,
+    ) -> List[sqlite3.Row]:
+        """Return pronunciations whose perfect rhyme key equals ``key``.
+
+        Ordered like :meth:`rhymes_by_key`.
+        """
+
+        return self._rows_by_key(
+            "perfect_rhyme_key",
+            key,
+            part_of_speech=part_of_speech,
+            limit=limit,
+            exclude_word_ids=exclude_word_ids,
+        )
+
+    def _rows_by_key(
+        self,
+        column: str,
+        key: str,
+        *,
+        part_of_speech: Optional[str] = None,
+        definition_query: Optional[str] = None,
+        synonym_query: Optional[str] = None,
+        limit: Optional[int] = None,
+        exclude_word_ids: Optional[Iterable[int]] = None,
+    ) -> List[sqlite3.Row]:
+        conditions, params = self._lexical_conditions(part_of_speech, definition_query, synonym_query)
+        conditions.insert(0, f"pronunciations.{column} = ?")
+        params.insert(0, key)
+        excluded = list(exclude_word_ids or ())
+        if excluded:
+            conditions.append(f"words.id NOT IN ({','.join('?' for _ in excluded)})")
+            params.extend(excluded)
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT ?"
+            params.append(limit)
+        query = f"""
+            SELECT pronunciations.*, words.word, words.id as word_id
+            FROM pronunciations
+            JOIN words ON words.id = pronunciations.word_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY pronunciations.syllable_count DESC, words.word
+            {limit_clause}
+        """
+        return list(self.conn.execute(query, tuple(params)))
+
+    def rhymes_by_keys(
+        self,
+        keys_by_syllables: Mapping[int, Iterable[str]],
+        *,
+        part_of_speech: Optional[str] = None,
+        limit_per_key: Optional[int] = None,
+    ) -> Dict[Tuple[int, str], List[sqlite3.Row]]:
+        """Look up several rhyme keys at once, issuing one query per syllable count.
+
+        Returns rows grouped by ``(syllables, key)``, each group in ranking
+        order and truncated to ``limit_per_key``.
+        """
+
+        grouped: Dict[Tuple[int, str], List[sqlite3.Row]] = {}
+        for syllables, keys in keys_by_syllables.items():
+            unique_keys = list(dict.fromkeys(keys))
+            if not unique_keys:
+                continue
+            if not 1 <= syllables <= MAX_PRECOMPUTED_RHYME_KEY:
+                raise ValueError(f"Rhyme keys are only stored for 1-{MAX_PRECOMPUTED_RHYME_KEY} syllables")
+            conditions, params = self._lexical_conditions(part_of_speech, None, None)
+            column = f"rhyme_key_{syllables}"
+            conditions.insert(0, f"pronunciations.{column} IN ({','.join('?' for _ in unique_keys)})")
+            params[:0] = unique_keys
+            query = f"""
+                SELECT pronunciations.*, words.word, words.id as word_id
+                FROM pronunciations
+                JOIN words ON words.id = pronunciations.word_id
+                WHERE {' AND '.join(conditions)}
+                ORDER BY pronunciations.syllable_count DESC, words.word
+            """
+            for key in unique_keys:
+                grouped[(syllables, key)] = []
+            for row in self.conn.execute(query, tuple(params)):
+                bucket = grouped[(syllables, row[column])]
+                if limit_per_key is None or len(bucket) < limit_per_key:
+                    bucket.append(row)
+        return grouped
+
+    def _lexical_conditions(
+        self,
+        part_of_speech: Optional[str],
+        definition_query: Optional[str],
+        synonym_query: Optional[str],
+    ) -> Tuple[List[str], List[object]]:
         conditions: List[str] = []
-        params: List[str] = []
+        params: List[object] = []
+        # Each filter is an uncorrelated subquery: SQLite evaluates it once
+        # into a temporary index rather than re-running it for every row.
         if part_of_speech:
             conditions.append(
-                "EXISTS (SELECT 1 FROM definitions WHERE definitions.word_id = words.id AND definitions.part_of_speech = ?)"
+                "words.id IN (SELECT word_id FROM definitions WHERE part_of_speech = ?)"
             )
             params.append(part_of_speech)
+        # The trigram FTS tables answer the same LIKE patterns from an index;
+        # fall back to the base tables when they are unavailable.
+        if self._has_fts():
+            definition_source = "definitions_fts JOIN definitions ON definitions.id = definitions_fts.rowid"
+            definition_column = "definitions_fts.definition"
+            synonym_source = "synonyms_fts JOIN synonyms ON synonyms.id = synonyms_fts.rowid"
+            synonym_column = "synonyms_fts.synonym"
+        else:
+            definition_source = "definitions"
+            definition_column = "definitions.definition"
+            synonym_source = "synonyms"
+            synonym_column = "synonyms.synonym"
         if definition_query:
             conditions.append(
-                "EXISTS (SELECT 1 FROM definitions WHERE definitions.word_id = words.id AND definitions.definition LIKE ?)"
+                f"""words.id IN (
+                    SELECT definitions.word_id
+                    FROM {definition_source}
+                    WHERE {definition_column} LIKE ?
+                )"""
             )
             params.append(f"%{definition_query}%")
         if synonym_query:
             conditions.append(
-                "EXISTS (SELECT 1 FROM synonyms JOIN definitions ON synonyms.definition_id = definitions.id WHERE definitions.word_id = words.id AND synonyms.synonym LIKE ?)"
+                f"""words.id IN (
+                    SELECT definitions.word_id
+                    FROM {synonym_source}
+                    JOIN definitions ON definitions.id = synonyms.definition_id
+                    WHERE {synonym_column} LIKE ?
+                )"""
             )
             params.append(f"%{synonym_query}%")
+        return conditions, params
 
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        query = f"""
-            SELECT pronunciations.*, words.word, words.id as word_id
-            FROM pronunciations
-            JOIN words ON words.id = pronunciations.word_id
-            {where_clause}
-            ORDER BY words.word
-        """
-        return self.conn.execute(query, tuple(params))
+
+def pronunciation_record(pronunciation: Sequence[str] | str) -> Tuple:
+    """Return the stored ``pronunciations`` column values, excluding ``word_id``."""
+
+    pron = to_pronunciation(pronunciation)
+    features = _pronunciation_features(pron)
+    return (
+        pron.text,
+        pron.syllable_count,
+        pron.stress_pattern,
+        features["terminal_vowels"],
+        features["terminal_consonants"],
+        features["terminal_both"],
+        features["rhyme_key_1"],
+        features["rhyme_key_2"],
+        features["rhyme_key_3"],
+        features["rhyme_key_4"],
+        features["phonemes_no_stress"],
+        pron.perfect_rhyme_key(),
+    )
 
 
 def _pronunciation_features(pron: Pronunciation) -> Dict[str, Optional[str]]:
-    features: Dict[str, Optional[str]] = {}
-    features["terminal_vowels"] = pron.terminal_vowels(1)
-    features["terminal_consonants"] = pron.terminal_consonants()
-    features["terminal_both"] = pron.rhyme_key(1)
-    for syllables in range(1, 5):
-        features[f"rhyme_key_{syllables}"] = pron.rhyme_key(syllables)
-    features["phonemes_no_stress"] = pron.strip_stress().text
+    phonemes = pron.phonemes
+    indices = pron.vowel_indices
+    features: Dict[str, Optional[str]] = {
+        "terminal_vowels": None,
+        "terminal_consonants": "",
+        "rhyme_key_1": None,
+        "rhyme_key_2": None,
+        "rhyme_key_3": None,
+        "rhyme_key_4": None,
+    }
+    if indices:
+        # Walk backwards over the vowels, extending the previous rhyme key by
+        # the syllable in front of it rather than re-joining every suffix.
+        last_vowel = indices[-1]
+        consonants = " ".join(phonemes[last_vowel + 1 :])
+        key = f"{phonemes[last_vowel]} {consonants}" if consonants else phonemes[last_vowel]
+        features["terminal_vowels"] = phonemes[last_vowel]
+        features["terminal_consonants"] = consonants
+        features["rhyme_key_1"] = key
+        for syllables in range(2, min(len(indices), MAX_PRECOMPUTED_RHYME_KEY) + 1):
+            start, end = indices[-syllables], indices[-syllables + 1]
+            key = f"{' '.join(phonemes[start:end])} {key}"
+            features[f"rhyme_key_{syllables}"] = key
+    features["terminal_both"] = features["rhyme_key_1"]
+    features["phonemes_no_stress"] = " ".join([strip_stress(p) for p in phonemes])
     return features
-
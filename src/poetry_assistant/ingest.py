@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:  # pragma: no cover - optional dependency setup
     import nltk
@@ -19,12 +22,19 @@ except ModuleNotFoundError:  # pragma: no cover - degrade gracefully
     def tqdm(iterable, **_kwargs):  # type: ignore[no-redef]
         return iterable
 
-from .database import PoetryDatabase
+from .database import PoetryDatabase, pronunciation_record
+from .phonetics import intern_phonemes
 
 LOGGER = logging.getLogger(__name__)
 
 CMU_URL = "https://svn.code.sf.net/p/cmusphinx/code/trunk/cmudict/cmudict-0.7b"
 
+_CMU_LINE_RE = re.compile(r"^(?P<word>[A-Z'\-.]+)(?:\((?P<variant>\d+)\))?\s+(?P<phones>.+)")
+_CMU_WORD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ'-.")
+
+CMU_CHUNK_SIZE = 4096
+DEFINITION_BATCH_SIZE = 10_000
+
 POS_MAP = {
     "n": "noun",
     "v": "verb",
@@ -66,7 +76,6 @@ def download_cmudict(destination: Path | None = None) -> Path:
 def parse_cmudict(path: Path) -> Iterator[Tuple[str, List[str]]]:
     """Yield ``(word, phonemes)`` from a CMU dictionary file."""
 
-    pattern = re.compile(r"^(?P<word>[A-Z'\-.]+)(?:\((?P<variant>\d+)\))?\s+(?P<phones>.+)")
     # The upstream CMU dictionary occasionally contains Latin-1 bytes in
     # comment lines (for example ``CAF\xc9``).  Opening the file with the
     # default UTF-8 reader would raise a ``UnicodeDecodeError`` when such
@@ -78,44 +87,104 @@ def parse_cmudict(path: Path) -> Iterator[Tuple[str, List[str]]]:
             line = raw_line.strip()
             if not line or line.startswith(";;;"):
                 continue
-            match = pattern.match(line)
-            if not match:
-                continue
-            word = match.group("word").lower()
-            phones = match.group("phones").split()
-            yield word, phones
-
-
-def ingest_cmudict(db: PoetryDatabase, cmu_path: Path) -> Dict[str, int]:
-    """Ingest pronunciations into the database."""
-
-    word_ids: Dict[str, int] = {}
-    for word, phones in tqdm(parse_cmudict(cmu_path), desc="CMU"):
-        word_id = word_ids.get(word)
-        if word_id is None:
-            word_id = db.add_word(word)
-            word_ids[word] = word_id
-        db.add_pronunciation(word_id, phones)
-    return word_ids
+            entry = _parse_cmu_line(line)
+            if entry is not None:
+                yield entry
+
+
+def _parse_cmu_line(line: str) -> Optional[Tuple[str, List[str]]]:
+    """Split a stripped CMU entry into its lowercase word and phonemes."""
+
+    # Entries are ``WORD[(n)]  PHONES``; plain string splitting handles them
+    # without running the regex, which is kept for anything unusual.
+    parts = line.split(None, 1)
+    if len(parts) == 2:
+        head, phones = parts
+        word, paren, variant = head.partition("(")
+        well_formed_variant = not paren or (variant.endswith(")") and variant[:-1].isdigit())
+        if word and well_formed_variant and _CMU_WORD_CHARS.issuperset(word):
+            return word.lower(), intern_phonemes(phones.split())
+    match = _CMU_LINE_RE.match(line)
+    if not match:
+        return None
+    return match.group("word").lower(), intern_phonemes(match.group("phones").split())
+
+
+def ingest_cmudict(
+    db: PoetryDatabase,
+    cmu_path: Path,
+    workers: Optional[int] = None,
+    *,
+    fresh: bool = False,
+) -> Dict[str, int]:
+    """Ingest pronunciations into the database.
+
+    Feature extraction for large files is spread over ``workers`` processes
+    (defaulting to the CPU count) while this process remains the only writer.
+    ``fresh`` marks a newly created file and trades crash safety for speed;
+    see :meth:`PoetryDatabase.bulk_ingest_records`.
+    """
+
+    entries = tqdm(parse_cmudict(cmu_path), desc="CMU")
+    return db.bulk_ingest_records(_pronunciation_records(entries, workers), fresh=fresh)
+
+
+def _pronunciation_records(
+    entries: Iterable[Tuple[str, List[str]]], workers: Optional[int]
+) -> Iterator[Tuple[str, Tuple]]:
+    chunks = _chunked(entries, CMU_CHUNK_SIZE)
+    leading = list(islice(chunks, 2))
+    if len(leading) < 2 or (workers or os.cpu_count() or 1) <= 1:
+        # A single chunk is not worth the cost of starting worker processes.
+        for chunk in chain(leading, chunks):
+            yield from _compute_records_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for records in pool.map(_compute_records_chunk, chain(leading, chunks)):
+            yield from records
+
+
+def _compute_records_chunk(chunk: List[Tuple[str, List[str]]]) -> List[Tuple[str, Tuple]]:
+    return [(word, pronunciation_record(phones)) for word, phones in chunk]
+
+
+def _chunked(
+    entries: Iterable[Tuple[str, List[str]]], size: int
+) -> Iterator[List[Tuple[str, List[str]]]]:
+    iterator = iter(entries)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def ingest_wordnet(db: PoetryDatabase, word_ids: Dict[str, int]) -> None:
     """Populate definitions and synonyms using WordNet."""
 
     ensure_nltk_data()
+    # Many words share synsets; extract each synset's payload only once.
+    synset_details: Dict[str, Tuple[Optional[str], str, Optional[str], Tuple[Tuple[str, str], ...]]] = {}
+    staged = 0
     for word, word_id in tqdm(word_ids.items(), desc="WordNet"):
-        synsets = wn.synsets(word)
-        for synset in synsets:
-            pos = POS_MAP.get(synset.pos())
-            definition = synset.definition()
-            examples = synset.examples()
-            example = examples[0] if examples else None
-            synonyms = {
-                lemma.name().replace("_", " ").lower()
-                for lemma in synset.lemmas()
-                if lemma.name().lower() != word
-            }
-            db.add_definition(
+        for synset in wn.synsets(word):
+            details = synset_details.get(synset.name())
+            if details is None:
+                examples = synset.examples()
+                lemma_names = tuple(
+                    (name.lower(), name.replace("_", " ").lower())
+                    for name in (lemma.name() for lemma in synset.lemmas())
+                )
+                details = (
+                    POS_MAP.get(synset.pos()),
+                    synset.definition(),
+                    examples[0] if examples else None,
+                    lemma_names,
+                )
+                synset_details[synset.name()] = details
+            pos, definition, example, lemma_names = details
+            synonyms = {display for raw, display in lemma_names if raw != word}
+            db.stage_definition(
                 word_id,
                 pos,
                 definition,
@@ -123,6 +192,11 @@ def ingest_wordnet(db: PoetryDatabase, word_ids: Dict[str, int]) -> None:
                 source="wordnet",
                 synonyms=sorted(synonyms),
             )
+            staged += 1
+            if staged >= DEFINITION_BATCH_SIZE:
+                db.flush_definitions()
+                staged = 0
+    db.flush_definitions()
 
 
 def build_database(
@@ -137,6 +211,7 @@ def build_database(
     parent = db_path.parent
     if parent != Path(".") and not parent.exists():
         parent.mkdir(parents=True, exist_ok=True)
+    fresh = not db_path.exists()
     db = PoetryDatabase(db_path)
     db.initialize()
 
@@ -152,7 +227,7 @@ def build_database(
             raise FileNotFoundError(cmu_source)
 
     LOGGER.info("Ingesting pronunciations from %s", cmu_path)
-    word_ids = ingest_cmudict(db, cmu_path)
+    word_ids = ingest_cmudict(db, cmu_path, fresh=fresh)
     LOGGER.info("Loaded %s unique words", len(word_ids))
 
     if include_wordnet:
@@ -1,8 +1,14 @@
 """Utilities for working with ARPABET pronunciations and stresses."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz.distance import Levenshtein as _RapidLevenshtein
+except ImportError:  # pragma: no cover - pure Python kernels are used instead
+    _RapidLevenshtein = None
 
 ARPABET_VOWELS = {
     "AA",
@@ -22,12 +28,79 @@ ARPABET_VOWELS = {
     "UW",
 }
 
+ARPABET_CONSONANTS = {
+    "B",
+    "CH",
+    "D",
+    "DH",
+    "F",
+    "G",
+    "HH",
+    "JH",
+    "K",
+    "L",
+    "M",
+    "N",
+    "NG",
+    "P",
+    "R",
+    "S",
+    "SH",
+    "T",
+    "TH",
+    "V",
+    "W",
+    "Y",
+    "Z",
+    "ZH",
+}
+
+# Per-token lookup table: the stress digit of every vowel token and ``""`` for
+# consonants. Hot paths classify a phoneme with a single dict lookup instead
+# of stripping digits and probing the vowel set. Tokens outside ARPABET are
+# classified by :func:`_classify_phoneme` on every use and never stored, so
+# query text cannot grow the table.
+_PHONEME_STRESS: Dict[str, str] = {consonant: "" for consonant in ARPABET_CONSONANTS}
+for _vowel in ARPABET_VOWELS:
+    _PHONEME_STRESS[_vowel] = "0"
+    for _digit in "012":
+        _PHONEME_STRESS[_vowel + _digit] = _digit
+
+# Canonical string object for every known ARPABET token. Fixed at import so
+# arbitrary query text can never grow it.
+_PHONEME_POOL: Dict[str, str] = {phoneme: phoneme for phoneme in _PHONEME_STRESS}
+
+# Patterns up to this many phonemes use the bit-parallel edit distance; the
+# bound mirrors a single machine word so the bit-vectors stay small ints.
+_MYERS_MAX_PATTERN = 64
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Pronunciation:
     """Structured representation of a pronunciation."""
 
     phonemes: Sequence[str]
+    _vowel_idx: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _syllable_count: int = field(init=False, repr=False, compare=False)
+    _stress: str = field(init=False, repr=False, compare=False)
+    # Rhyme keys by syllable count, with ``None`` for the perfect rhyme key.
+    # Created on first use; instances shared via ``pronunciation_from_text``
+    # are asked for the same keys over and over.
+    _keys: Optional[Dict[Optional[int], Optional[str]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Derived scalars are computed once here; the instance is frozen so
+        # they are assigned through object.__setattr__.
+        indices = tuple(_vowel_indices(self.phonemes))
+        object.__setattr__(self, "_vowel_idx", indices)
+        object.__setattr__(self, "_syllable_count", len(indices))
+        phonemes = self.phonemes
+        object.__setattr__(
+            self, "_stress", "".join(phoneme_stress(phonemes[index]) for index in indices)
+        )
+        object.__setattr__(self, "_keys", None)
 
     @property
     def text(self) -> str:
@@ -35,63 +108,73 @@ class Pronunciation:
 
         return " ".join(self.phonemes)
 
+    @property
+    def vowel_indices(self) -> Tuple[int, ...]:
+        """Positions of the vowel phonemes, one per syllable, in order."""
+
+        return self._vowel_idx
+
     @property
     def syllable_count(self) -> int:
         """Number of syllables in the pronunciation."""
 
-        return sum(1 for p in self.phonemes if is_vowel(p))
+        return self._syllable_count
 
     @property
     def stress_pattern(self) -> str:
         """Return stress digits for vowels in order."""
 
-        stresses: List[str] = []
-        for phoneme in self.phonemes:
-            if is_vowel(phoneme):
-                stress = phoneme[-1]
-                stresses.append(stress if stress.isdigit() else "0")
-        return "".join(stresses)
+        return self._stress
 
     def rhyme_key(self, syllables: int) -> Optional[str]:
         """Return the canonical rhyme key for the last ``syllables`` syllables."""
 
-        indices = _vowel_indices(self.phonemes)
+        keys = self._keys
+        if keys is None:
+            keys = {}
+            object.__setattr__(self, "_keys", keys)
+        elif syllables in keys:
+            return keys[syllables]
+        indices = self._vowel_idx
         if not indices or len(indices) < syllables:
-            return None
-        start = indices[-syllables]
-        return " ".join(self.phonemes[start:])
+            key = None
+        else:
+            key = " ".join(self.phonemes[indices[-syllables] :])
+        keys[syllables] = key
+        return key
 
     def perfect_rhyme_key(self) -> Optional[str]:
         """Return substring covering the final stressed syllable and any trailing syllables."""
 
-        last_primary: Optional[int] = None
-        for index, phoneme in enumerate(self.phonemes):
-            if not is_vowel(phoneme):
-                continue
-            stress = phoneme[-1] if phoneme[-1].isdigit() else "0"
-            if stress == "1":
-                last_primary = index
-        if last_primary is None:
-            return None
-        return " ".join(self.phonemes[last_primary:])
+        keys = self._keys
+        if keys is None:
+            keys = {}
+            object.__setattr__(self, "_keys", keys)
+        elif None in keys:
+            return keys[None]
+        phonemes = self.phonemes
+        key = None
+        # Scan backwards so the search stops at the last primary stress.
+        for index in reversed(self._vowel_idx):
+            if phoneme_stress(phonemes[index]) == "1":
+                key = " ".join(phonemes[index:])
+                break
+        keys[None] = key
+        return key
 
     def terminal_vowels(self, syllables: int = 1) -> Optional[str]:
         """Return the vowel portion of the final syllables."""
 
-        indices = _vowel_indices(self.phonemes)
+        indices = self._vowel_idx
         if not indices or len(indices) < syllables:
             return None
-        start = indices[-syllables]
-        vowels: List[str] = []
-        for phoneme in self.phonemes[start:]:
-            if is_vowel(phoneme):
-                vowels.append(phoneme)
-        return " ".join(vowels) if vowels else None
+        vowels = [self.phonemes[index] for index in indices[-syllables:]]
+        return " ".join(vowels)
 
     def terminal_consonants(self) -> str:
         """Return trailing consonant phonemes after the last vowel."""
 
-        indices = _vowel_indices(self.phonemes)
+        indices = self._vowel_idx
         if not indices:
             return ""
         last_vowel_index = indices[-1]
@@ -105,11 +188,15 @@ class Pronunciation:
 
 
 def tokens(pronunciation: str) -> List[str]:
-    """Split a CMU pronunciation string into tokens."""
+    """Split a CMU pronunciation string into tokens.
+
+    Tokens are drawn from the shared phoneme pool (see :func:`intern_phonemes`).
+    """
 
-    return [part for part in pronunciation.strip().split() if part]
+    return intern_phonemes(pronunciation.split())
 
 
+@lru_cache(maxsize=256)
 def is_vowel(phoneme: str) -> bool:
     """Return ``True`` if the phoneme represents a vowel."""
 
@@ -117,14 +204,45 @@ def is_vowel(phoneme: str) -> bool:
     return base in ARPABET_VOWELS
 
 
+@lru_cache(maxsize=256)
 def strip_stress(phoneme: str) -> str:
     """Remove stress digits from a phoneme."""
 
     return phoneme.rstrip("0123456789")
 
 
+def phoneme_stress(phoneme: str) -> str:
+    """Return the stress digit of a vowel (``"0"`` if unmarked), or ``""`` for a consonant."""
+
+    stress = _PHONEME_STRESS.get(phoneme)
+    return _classify_phoneme(phoneme) if stress is None else stress
+
+
+def phoneme_stresses(phonemes: Sequence[str]) -> List[str]:
+    """Return :func:`phoneme_stress` for every phoneme, in one pass over the table."""
+
+    table = _PHONEME_STRESS
+    try:
+        return [table[phoneme] for phoneme in phonemes]
+    except KeyError:
+        return [phoneme_stress(phoneme) for phoneme in phonemes]
+
+
 def _vowel_indices(phonemes: Sequence[str]) -> List[int]:
-    return [index for index, phoneme in enumerate(phonemes) if is_vowel(phoneme)]
+    table = _PHONEME_STRESS
+    try:
+        return [index for index, phoneme in enumerate(phonemes) if table[phoneme]]
+    except KeyError:
+        # Rare: the pronunciation contains a token outside ARPABET.
+        return [index for index, phoneme in enumerate(phonemes) if phoneme_stress(phoneme)]
+
+
+def _classify_phoneme(phoneme: str) -> str:
+    """Return the stress table entry ``phoneme`` would have."""
+
+    if is_vowel(phoneme):
+        return phoneme[-1] if phoneme[-1].isdigit() else "0"
+    return ""
 
 
 def to_pronunciation(pronunciation: Iterable[str] | str) -> Pronunciation:
@@ -133,44 +251,199 @@ def to_pronunciation(pronunciation: Iterable[str] | str) -> Pronunciation:
     if isinstance(pronunciation, str):
         phonemes = tokens(pronunciation)
     else:
-        phonemes = list(pronunciation)
+        phonemes = intern_phonemes(pronunciation)
     return Pronunciation(tuple(phonemes))
 
 
-def levenshtein_distance(left: Sequence[str], right: Sequence[str]) -> int:
-    """Compute Levenshtein distance between two phoneme sequences."""
+@lru_cache(maxsize=200_000)
+def pronunciation_from_text(text: str) -> Pronunciation:
+    """Return the :class:`Pronunciation` for a stored pronunciation string.
+
+    Instances are immutable, so one object is shared per distinct string,
+    and phoneme tokens are interned. Call
+    ``pronunciation_from_text.cache_clear()`` after reloading a database to
+    release the memory.
+    """
+
+    return Pronunciation(tuple(intern_phonemes(text.split())))
+
+
+@lru_cache(maxsize=200_000)
+def rhyme_key_from_text(text: str, syllables: int) -> Optional[str]:
+    """Return the rhyme key of ``syllables`` for a pronunciation string."""
+
+    return pronunciation_from_text(text).rhyme_key(syllables)
+
+
+def intern_phonemes(phonemes: Iterable[str]) -> List[str]:
+    """Return ``phonemes`` with each token replaced by a shared string object.
+
+    The ARPABET alphabet is tiny, so pooling tokens avoids allocating
+    millions of duplicate strings during ingestion and lets equality checks
+    short-circuit on identity. Only known ARPABET tokens are pooled; any
+    other token is returned unchanged.
+    """
+
+    pool = _PHONEME_POOL
+    return [pool.get(phoneme, phoneme) for phoneme in phonemes]
+
+
+def levenshtein_distance(
+    left: Sequence[str], right: Sequence[str], max_distance: Optional[int] = None
+) -> int:
+    """Compute Levenshtein distance between two phoneme sequences.
+
+    When ``max_distance`` is given the computation stops as soon as the
+    distance is known to exceed it, returning ``max_distance + 1``.
+    """
 
     if left == right:
         return 0
+    if max_distance is not None and abs(len(left) - len(right)) > max_distance:
+        return max_distance + 1
     if not left:
         return len(right)
     if not right:
         return len(left)
-
-    prev_row = list(range(len(right) + 1))
+    if _RapidLevenshtein is not None:
+        # Same cutoff contract: returns ``max_distance + 1`` when exceeded.
+        return _RapidLevenshtein.distance(left, right, score_cutoff=max_distance)
+    if len(left) > len(right):
+        left, right = right, left
+    if len(left) <= _MYERS_MAX_PATTERN:
+        return _myers_distance(left, right, max_distance)
+    return _dp_distance(left, right, max_distance)
+
+
+def _myers_distance(
+    pattern: Sequence[str], text: Sequence[str], max_distance: Optional[int] = None
+) -> int:
+    """Bit-parallel edit distance (Myers/Hyyrö) for patterns of up to 64 tokens.
+
+    Each DP column is encoded as vertical delta bit-vectors so a whole column
+    is advanced with a handful of integer operations per token of ``text``.
+    """
+
+    return _myers_scan(_myers_masks(pattern), len(pattern), text, max_distance)
+
+
+def _myers_masks(pattern: Sequence[str]) -> Dict[str, int]:
+    """Map each token of ``pattern`` to the bit-vector of its positions."""
+
+    peq: Dict[str, int] = {}
+    bit = 1
+    for token in pattern:
+        peq[token] = peq.get(token, 0) | bit
+        bit <<= 1
+    return peq
+
+
+def _myers_scan(
+    peq: Dict[str, int], size: int, text: Sequence[str], max_distance: Optional[int] = None
+) -> int:
+    mask = (1 << size) - 1
+    high = 1 << (size - 1)
+    positive = mask
+    negative = 0
+    score = size
+    remaining = len(text)
+    for token in text:
+        eq = peq.get(token, 0)
+        xv = eq | negative
+        xh = ((((eq & positive) + positive) & mask) ^ positive) | eq
+        horizontal_pos = negative | (~(xh | positive) & mask)
+        horizontal_neg = positive & xh
+        if horizontal_pos & high:
+            score += 1
+        elif horizontal_neg & high:
+            score -= 1
+        remaining -= 1
+        # The score can drop by at most one per remaining column.
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+        horizontal_pos = ((horizontal_pos << 1) | 1) & mask
+        horizontal_neg = (horizontal_neg << 1) & mask
+        positive = horizontal_neg | (~(xv | horizontal_pos) & mask)
+        negative = horizontal_pos & xv
+    return score
+
+
+def distance_from(pattern: Sequence[str]) -> Callable[[Sequence[str], Optional[int]], int]:
+    """Return ``f(other, max_distance)`` equal to ``levenshtein_distance(pattern, other, max_distance)``.
+
+    Use this when one sequence is compared against many others: the
+    bit-vectors of ``pattern`` are built once instead of on every call.
+    """
+
+    size = len(pattern)
+    if _RapidLevenshtein is not None or not 0 < size <= _MYERS_MAX_PATTERN:
+        return lambda other, max_distance=None: levenshtein_distance(pattern, other, max_distance)
+    peq = _myers_masks(pattern)
+
+    def distance(other: Sequence[str], max_distance: Optional[int] = None) -> int:
+        if max_distance is not None and abs(len(other) - size) > max_distance:
+            return max_distance + 1
+        if not other:
+            return size
+        return _myers_scan(peq, size, other, max_distance)
+
+    return distance
+
+
+def _dp_distance(
+    left: Sequence[str], right: Sequence[str], max_distance: Optional[int] = None
+) -> int:
+    # A single DP row is updated in place; ``diagonal`` carries the value of
+    # the previous row's cell to the upper-left so no per-row list is needed.
+    row = list(range(len(right) + 1))
     for i, token in enumerate(left, start=1):
-        current_row = [i]
+        diagonal = row[0]
+        row[0] = i
         for j, other in enumerate(right, start=1):
-            cost = 0 if token == other else 1
-            current_row.append(
-                min(
-                    current_row[-1] + 1,  # insertion
-                    prev_row[j] + 1,  # deletion
-                    prev_row[j - 1] + cost,  # substitution
-                )
-            )
-        prev_row = current_row
-    return prev_row[-1]
-
-
-def similarity(left: Sequence[str], right: Sequence[str]) -> float:
-    """Return a similarity score between 0 and 1 based on edit distance."""
+            above = row[j]
+            if token == other:
+                best = diagonal  # substitution at no cost
+            else:
+                best = diagonal + 1  # substitution
+                if above + 1 < best:
+                    best = above + 1  # deletion
+                if row[j - 1] + 1 < best:
+                    best = row[j - 1] + 1  # insertion
+            row[j] = best
+            diagonal = above
+        # Row minima never decrease, so the final distance is at least this.
+        if max_distance is not None and min(row) > max_distance:
+            return max_distance + 1
+    if max_distance is not None and row[-1] > max_distance:
+        return max_distance + 1
+    return row[-1]
+
+
+def similarity(
+    left: Sequence[str],
+    right: Sequence[str],
+    min_similarity: Optional[float] = None,
+    *,
+    distance: Optional[Callable[[Sequence[str], Optional[int]], int]] = None,
+) -> float:
+    """Return a similarity score between 0 and 1 based on edit distance.
+
+    With ``min_similarity`` the edit distance is bounded accordingly; scores
+    that cannot reach the threshold are returned as some value below it.
+    ``distance`` may be ``distance_from(left)`` when ``left`` is reused.
+    """
 
     if not left and not right:
         return 1.0
-    distance = levenshtein_distance(left, right)
     normalizer = max(len(left), len(right))
     if normalizer == 0:
         return 1.0
-    return max(0.0, 1.0 - distance / normalizer)
-
+    max_distance = None
+    if min_similarity is not None:
+        # The small epsilon keeps float rounding from tightening the bound.
+        max_distance = max(0, int((1.0 - min_similarity) * normalizer + 1e-9))
+    if distance is None:
+        edits = levenshtein_distance(left, right, max_distance)
+    else:
+        edits = distance(right, max_distance)
+    return max(0.0, 1.0 - edits / normalizer)
@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+import sqlite3
+from dataclasses import replace
 from typing import Dict, List, Optional, Tuple
 
-from .database import PoetryDatabase
+from .database import MAX_PRECOMPUTED_RHYME_KEY, PoetryDatabase
 from .models import SearchResult
-from .phonetics import Pronunciation
+from .phonetics import Pronunciation, pronunciation_from_text
 from .search import SearchEngine, SearchOptions
 
 WORD_RE = re.compile(r"[A-Za-z']+")
 
+_WORD_CACHE_SIZE = 4096
+
 
 class RhymeAssistant:
     """Combine pronunciation lookups and search queries."""
@@ -19,10 +22,14 @@ class RhymeAssistant:
     def __init__(self, db: PoetryDatabase):
         self.db = db
         self.search = SearchEngine(db)
+        self._word_rows: Dict[str, List[sqlite3.Row]] = {}
+        self._word_rows_generation = db.generation
+        self._perfect: Dict[tuple, Dict[str, List[SearchResult]]] = {}
+        self._perfect_generation = db.generation
 
     def pronunciations_for_word(self, word: str) -> List[Pronunciation]:
-        rows = self.db.pronunciations_for_word(word)
-        return [Pronunciation(tuple(row["pronunciation"].split())) for row in rows]
+        rows = self._pronunciation_rows(word)
+        return [pronunciation_from_text(row["pronunciation"]) for row in rows]
 
     def suggest_rhymes(
         self,
@@ -36,14 +43,35 @@ class RhymeAssistant:
         """Suggest rhyming words for the final syllables of ``line``."""
 
         candidates = self._line_pronunciations(line)
-        results: Dict[int, List[SearchResult]] = defaultdict(list)
-        seen = set()
+        jobs: List[Tuple[str, int, str]] = []
         for word_text, pron in candidates:
             syllable_count = pron.syllable_count
             for syllables in range(1, min(max_syllables, syllable_count) + 1):
                 rhyme_key = pron.rhyme_key(syllables)
-                if not rhyme_key:
-                    continue
+                if rhyme_key:
+                    jobs.append((word_text, syllables, rhyme_key))
+
+        exact_matches: Dict[Tuple[int, str], List[SearchResult]] = {}
+        near_enabled = max_distance is not None or min_similarity is not None
+        if not near_enabled:
+            # Exact rhymes over the stored keys are fetched in one batch.
+            exact_matches = self.search.exact_rhyme_matches(
+                (
+                    (syllables, rhyme_key)
+                    for _, syllables, rhyme_key in jobs
+                    if syllables <= MAX_PRECOMPUTED_RHYME_KEY
+                ),
+                part_of_speech=part_of_speech,
+                limit=max_results,
+                include_definitions=False,
+            )
+
+        # First match per (word, syllables) in job order; doubles as the dedupe set.
+        best: Dict[Tuple[str, int], SearchResult] = {}
+        for word_text, syllables, rhyme_key in jobs:
+            if (syllables, rhyme_key) in exact_matches:
+                matches = exact_matches[(syllables, rhyme_key)]
+            else:
                 options = SearchOptions(
                     pattern=rhyme_key,
                     pattern_type="rhyme",
@@ -52,18 +80,26 @@ class RhymeAssistant:
                     min_similarity=min_similarity,
                     part_of_speech=part_of_speech,
                     limit=max_results,
+                    include_definitions=False,
                 )
                 matches = self.search.search(options)
-                for match in matches:
-                    if match.word.lower() == word_text.lower():
-                        continue
-                    key = (match.word.lower(), syllables)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    if max_results is None or len(results[syllables]) < max_results:
-                        results[syllables].append(match)
-        return dict(sorted(results.items(), reverse=True))
+            word_lower = word_text.lower()
+            for match in matches:
+                match_word = match.word.lower()
+                if match_word == word_lower:
+                    continue
+                key = (match_word, syllables)
+                if key not in best:
+                    best[key] = match
+
+        results: Dict[int, List[SearchResult]] = {}
+        for (_, syllables), match in best.items():
+            if max_results is not None and len(results.get(syllables, ())) >= max_results:
+                continue
+            results.setdefault(syllables, []).append(match)
+        # Definitions are only loaded for the results that are returned.
+        self.search.attach_definitions(match for group in results.values() for match in group)
+        return {syllables: results[syllables] for syllables in sorted(results, reverse=True)}
 
     def perfect_rhymes(
         self,
@@ -71,15 +107,38 @@ class RhymeAssistant:
         max_results: Optional[int] = 25,
         part_of_speech: Optional[str] = None,
     ) -> Dict[str, List[SearchResult]]:
-        """Return perfect rhyme suggestions keyed by pronunciation."""
+        """Return perfect rhyme suggestions keyed by pronunciation.
+
+        Results are cached per query until the next database write.
+        """
+
+        generation = self.db.generation
+        if self._perfect_generation != generation:
+            self._perfect.clear()
+            self._perfect_generation = generation
+        cache_key = (word, max_results, part_of_speech)
+        cached = self._perfect.get(cache_key)
+        if cached is None:
+            cached = self._perfect_rhymes(word, max_results, part_of_speech)
+            if len(self._perfect) >= _WORD_CACHE_SIZE:
+                self._perfect.clear()
+            self._perfect[cache_key] = cached
+        # Callers get copies so changes to them never reach the cache.
+        return {
+            text: [replace(match, definitions=list(match.definitions)) for match in matches]
+            for text, matches in cached.items()
+        }
 
-        rows = self.db.pronunciations_for_word(word)
+    def _perfect_rhymes(
+        self, word: str, max_results: Optional[int], part_of_speech: Optional[str]
+    ) -> Dict[str, List[SearchResult]]:
+        rows = self._pronunciation_rows(word)
         if not rows:
             return {}
         target_ids = {int(row["word_id"]) for row in rows}
         suggestions: Dict[str, List[SearchResult]] = {}
         for row in rows:
-            pronunciation = Pronunciation(tuple(row["pronunciation"].split()))
+            pronunciation = pronunciation_from_text(row["pronunciation"])
             key = pronunciation.perfect_rhyme_key()
             if not key:
                 continue
@@ -88,19 +147,39 @@ class RhymeAssistant:
                 part_of_speech=part_of_speech,
                 limit=max_results,
                 exclude_word_ids=target_ids,
+                include_definitions=False,
             )
             suggestions[pronunciation.text] = matches
+        self.search.attach_definitions(
+            match for group in suggestions.values() for match in group
+        )
         return dict(sorted(suggestions.items()))
 
     def _line_pronunciations(self, line: str) -> List[Tuple[str, Pronunciation]]:
-        words = WORD_RE.findall(line.lower())
         pronunciations: List[Tuple[str, Pronunciation]] = []
-        for word in reversed(words):
-            rows = self.db.pronunciations_for_word(word)
+        # WORD_RE matches the same words in the reversed line, so scanning it
+        # lazily visits words from the end and stops at the first known one.
+        for match in WORD_RE.finditer(line[::-1]):
+            word = match.group()[::-1].lower()
+            rows = self._pronunciation_rows(word)
             for row in rows:
-                pronunciation = Pronunciation(tuple(row["pronunciation"].split()))
+                pronunciation = pronunciation_from_text(row["pronunciation"])
                 pronunciations.append((word, pronunciation))
             if pronunciations:
                 break
         return pronunciations
 
+    def _pronunciation_rows(self, word: str) -> List[sqlite3.Row]:
+        """Return the stored pronunciation rows for ``word``, cached until the next write."""
+
+        generation = self.db.generation
+        if self._word_rows_generation != generation:
+            self._word_rows.clear()
+            self._word_rows_generation = generation
+        rows = self._word_rows.get(word)
+        if rows is None:
+            rows = self.db.pronunciations_for_word(word)
+            if len(self._word_rows) >= _WORD_CACHE_SIZE:
+                self._word_rows.clear()
+            self._word_rows[word] = rows
+        return rows
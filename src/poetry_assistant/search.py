@@ -2,25 +2,51 @@
 from __future__ import annotations
 
 import fnmatch
+import heapq
+import math
 import re
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Set, Tuple
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
-from .database import PoetryDatabase
+from .database import MAX_PRECOMPUTED_RHYME_KEY, PoetryDatabase
 from .models import SearchResult
-from .phonetics import Pronunciation, similarity, tokens
+from .phonetics import (
+    distance_from,
+    rhyme_key_from_text,
+    similarity,
+    tokens,
+)
 from .syllables import (
+    CompiledSyllablePattern,
     PatternElement,
-    find_syllable_matches,
+    SyllableIndex,
     parse_syllable_pattern,
     syllabify,
 )
 
+_WILDCARD_CHARS = frozenset("*?[]")
+
+_SEQUENCE_COLUMNS = {
+    "vowel": "terminal_vowels",
+    "consonant": "terminal_consonants",
+    "both": "terminal_both",
+    "phonemes": "pronunciation",
+}
+
+# Number of distinct queries whose results each engine keeps.
+_SEARCH_CACHE_SIZE = 4096
 
-MAX_PRECOMPUTED_RHYME_KEY = 4
+# Above this many candidate sequences, fetching rows with an IN filter on
+# the sequence column is no cheaper than a plain scan.
+_MAX_CANDIDATE_SEQUENCES = 500
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchOptions:
     pattern: Optional[str] = None
     pattern_type: str = "rhyme"
@@ -35,6 +61,7 @@ class SearchOptions:
     definition_query: Optional[str] = None
     synonym_query: Optional[str] = None
     limit: Optional[int] = 50
+    include_definitions: bool = True
 
 
 class SearchEngine:
@@ -42,84 +69,171 @@ class SearchEngine:
 
     def __init__(self, db: PoetryDatabase):
         self.db = db
+        self._cache: OrderedDict[SearchOptions, List[SearchResult]] = OrderedDict()
+        self._cache_generation = db.generation
+        self._syllables: Optional[SyllableIndex] = None
+        self._syllables_generation = db.generation
 
     def search(self, options: SearchOptions) -> List[SearchResult]:
-        rows = self.db.iter_pronunciations(
-            part_of_speech=options.part_of_speech,
-            definition_query=options.definition_query,
-            synonym_query=options.synonym_query,
-        )
-        results: List[SearchResult] = []
+        """Return results for ``options``, reusing results of identical queries.
+
+        Cached results are copied on the way out, so callers may modify the
+        returned results freely.
+        """
+
+        results = self._cached_results(options)
+        if results is None:
+            results = self._search(options)
+            self._remember(options, results)
+        return _copy_results(results)
+
+    def _search(self, options: SearchOptions) -> List[SearchResult]:
+        if self._is_exact_rhyme_lookup(options):
+            assert options.pattern is not None
+            rows = self.db.rhymes_by_key(
+                options.pattern,
+                max(1, options.syllables),
+                part_of_speech=options.part_of_speech,
+                definition_query=options.definition_query,
+                synonym_query=options.synonym_query,
+                limit=options.limit,
+            )
+            indexed = [self._result_from_row(row, 1.0) for row in rows]
+            if options.include_definitions:
+                self.attach_definitions(indexed)
+            return indexed
+
         syllable_pattern: Optional[List[PatternElement]] = None
         if options.pattern_type == "syllable":
             syllable_pattern = parse_syllable_pattern(options.pattern or "")
-        for row in rows:
-            score = None
-            match_span: Optional[Tuple[int, int]] = None
-            if options.pattern_type == "syllable":
-                syllables = syllabify(row["pronunciation"].split())
-                assert syllable_pattern is not None
-                matches = find_syllable_matches(
-                    syllables,
-                    syllable_pattern,
-                    contains=options.contains,
-                    ignore_stress=options.ignore_stress,
-                )
-                if not matches:
-                    continue
-                match_span = matches[0]
-                score = 1.0 if syllable_pattern else None
+        near_enabled = options.max_distance is not None or options.min_similarity is not None
+        # Patterns are compiled once here rather than re-translated per row.
+        pattern_matcher = None
+        if options.pattern and not near_enabled and options.pattern_type != "syllable":
+            pattern_matcher = self._compile_pattern(options)
+        stress_accepts = self._stress_patterns(options.stress_pattern)
+        pattern_tokens = tokens(options.pattern or "")
+        column, values = None, None
+        accepts: Optional[Callable[[str], bool]] = None
+        if options.pattern and near_enabled:
+            column, values = self._near_candidates(options, pattern_tokens)
+        elif syllable_pattern:
+            narrowed = self._syllable_index().candidates(
+                syllable_pattern, ignore_stress=options.ignore_stress
+            )
+            if narrowed is not None:
+                accepts = narrowed.__contains__
+                if len(narrowed) <= _MAX_CANDIDATE_SEQUENCES:
+                    column, values = "pronunciation", sorted(narrowed)
+        elif pattern_matcher is not None:
+            column = self._sequence_column(options)
+            if column is not None:
+                # Match each distinct stored sequence once instead of per row.
+                values = [
+                    value
+                    for value in self.db.distinct_sequences(column)
+                    if pattern_matcher(value) is not None
+                ]
+                accepts = set(values).__contains__
+                if len(values) > _MAX_CANDIDATE_SEQUENCES:
+                    column, values = None, None
             else:
-                sequence = self._sequence_from_row(row, options)
-                if sequence is None:
-                    continue
-                pattern_match = True
-                if options.pattern:
-                    pattern_match = self._matches_pattern(sequence, options)
-                    near_enabled = options.max_distance is not None or options.min_similarity is not None
-                    if not pattern_match and not near_enabled:
-                        continue
-            if options.stress_pattern:
-                if not match_wildcard(row["stress_pattern"] or "", options.stress_pattern):
-                    continue
-            if options.pattern_type != "syllable":
-                if options.pattern and options.max_distance is not None:
-                    distance = _edit_distance(sequence, options.pattern)
-                    if distance > options.max_distance:
-                        continue
-                    seq_tokens = sequence.split()
-                    pattern_tokens = tokens(options.pattern)
-                    normalizer = max(len(seq_tokens), len(pattern_tokens) or 1)
-                    score = 1.0 - distance / normalizer if normalizer else 1.0
-                elif options.pattern and options.min_similarity is not None:
-                    score = similarity(sequence.split(), tokens(options.pattern))
-                    if score < options.min_similarity:
-                        continue
-                elif options.pattern:
-                    if not pattern_match:
-                        continue
-                    score = 1.0
-            result = SearchResult(
-                word_id=row["word_id"],
-                word=row["word"],
-                pronunciation=row["pronunciation"],
-                syllable_count=row["syllable_count"],
-                stress_pattern=row["stress_pattern"],
-                similarity=score,
-                terminal_vowels=row["terminal_vowels"],
-                terminal_consonants=row["terminal_consonants"],
-                rhyme_key=row["rhyme_key_1"],
-                matched_syllables=match_span,
+                accepts = _matches(pattern_matcher)
+        cursor = self.db.iter_pronunciations(
+            part_of_speech=options.part_of_speech,
+            definition_query=options.definition_query,
+            synonym_query=options.synonym_query,
+            column=column,
+            values=values,
+        )
+        # Row lookups by name scan the column list, so the hot stages read
+        # columns by position, resolved once from the cursor description.
+        positions = {description[0]: index for index, description in enumerate(cursor.description)}
+
+        # Each stage below is a generator specialised for this query, so
+        # rows stream through without intermediate lists.
+        rows: Iterable[sqlite3.Row] = cursor
+        if stress_accepts is not None:
+            stress_index = positions["stress_pattern"]
+            rows = (row for row in rows if row[stress_index] in stress_accepts)
+        candidates: Iterable[SearchResult]
+        if syllable_pattern is not None:
+            candidates = self._syllable_results(
+                rows, syllable_pattern, accepts, options, positions["pronunciation"]
             )
-            results.append(result)
-            if options.limit is not None and len(results) >= options.limit and not options.pattern:
-                break
-        results.sort(key=self._result_sort_key)
+        else:
+            sequence_of = self._sequence_getter(options, positions)
+            if options.pattern and near_enabled:
+                candidates = self._near_results(rows, sequence_of, pattern_tokens, options)
+            else:
+                candidates = self._sequence_results(rows, sequence_of, accepts, options)
         limit = options.limit
-        limited = results if limit is None else results[:limit]
-        self._attach_definitions(limited)
+        if limit is not None and not options.pattern:
+            # Without a pattern every row matches; stop after the first ``limit``.
+            candidates = islice(candidates, limit)
+        if limit is None:
+            limited = sorted(candidates, key=self._result_sort_key)
+        else:
+            # Only the top ``limit`` results are kept, so avoid a full sort.
+            limited = heapq.nsmallest(limit, candidates, key=self._result_sort_key)
+        if options.include_definitions:
+            self.attach_definitions(limited)
         return limited
 
+    def _syllable_results(
+        self,
+        rows: Iterable[sqlite3.Row],
+        syllable_pattern: List[PatternElement],
+        accepts: Optional[Callable[[str], bool]],
+        options: SearchOptions,
+        pronunciation_index: int,
+    ) -> Iterator[SearchResult]:
+        score = 1.0 if syllable_pattern else None
+        matcher = CompiledSyllablePattern(syllable_pattern, ignore_stress=options.ignore_stress)
+        for row in rows:
+            pronunciation = row[pronunciation_index]
+            if accepts is not None and not accepts(pronunciation):
+                continue
+            span = matcher.first(syllabify(pronunciation), contains=options.contains)
+            if span is not None:
+                yield self._result_from_row(row, score, span)
+
+    def _near_results(
+        self,
+        rows: Iterable[sqlite3.Row],
+        sequence_of: Callable[[sqlite3.Row], Optional[str]],
+        pattern_tokens: List[str],
+        options: SearchOptions,
+    ) -> Iterator[SearchResult]:
+        # Rhyme keys repeat across many rows, so each distinct sequence is
+        # scored once and rejects are skipped cheaply.
+        scores: Dict[str, Optional[float]] = {}
+        distance = distance_from(pattern_tokens)
+        for row in rows:
+            sequence = sequence_of(row)
+            if sequence is None:
+                continue
+            if sequence in scores:
+                score = scores[sequence]
+            else:
+                score = scores[sequence] = _near_score(sequence, pattern_tokens, options, distance)
+            if score is not None:
+                yield self._result_from_row(row, score)
+
+    def _sequence_results(
+        self,
+        rows: Iterable[sqlite3.Row],
+        sequence_of: Callable[[sqlite3.Row], Optional[str]],
+        accepts: Optional[Callable[[str], bool]],
+        options: SearchOptions,
+    ) -> Iterator[SearchResult]:
+        score = 1.0 if options.pattern else None
+        for row in rows:
+            sequence = sequence_of(row)
+            if sequence is None or (accepts is not None and not accepts(sequence)):
+                continue
+            yield self._result_from_row(row, score)
+
     def perfect_rhyme_matches(
         self,
         key: str,
@@ -127,35 +241,160 @@ class SearchEngine:
         part_of_speech: Optional[str] = None,
         limit: Optional[int] = 50,
         exclude_word_ids: Optional[Iterable[int]] = None,
+        include_definitions: bool = True,
     ) -> List[SearchResult]:
         """Return pronunciations whose perfect rhyme key matches ``key``."""
 
-        excluded: Set[int] = set(exclude_word_ids or [])
-        rows = self.db.iter_pronunciations(part_of_speech=part_of_speech)
-        results: List[SearchResult] = []
-        for row in rows:
-            word_id = int(row["word_id"])
-            if word_id in excluded:
-                continue
-            pronunciation = Pronunciation(tuple(row["pronunciation"].split()))
-            if pronunciation.perfect_rhyme_key() != key:
-                continue
-            result = SearchResult(
-                word_id=word_id,
-                word=row["word"],
-                pronunciation=row["pronunciation"],
-                syllable_count=row["syllable_count"],
-                stress_pattern=row["stress_pattern"],
-                similarity=1.0,
-                terminal_vowels=row["terminal_vowels"],
-                terminal_consonants=row["terminal_consonants"],
-                rhyme_key=row["rhyme_key_1"],
+        rows = self.db.perfect_rhymes_by_key(
+            key,
+            part_of_speech=part_of_speech,
+            limit=limit,
+            exclude_word_ids=exclude_word_ids,
+        )
+        results = [self._result_from_row(row, 1.0) for row in rows]
+        if include_definitions:
+            self.attach_definitions(results)
+        return results
+
+    def exact_rhyme_matches(
+        self,
+        keys: Iterable[Tuple[int, str]],
+        *,
+        part_of_speech: Optional[str] = None,
+        limit: Optional[int] = 50,
+        include_definitions: bool = True,
+    ) -> Dict[Tuple[int, str], List[SearchResult]]:
+        """Return exact rhyme matches for many ``(syllables, rhyme_key)`` pairs.
+
+        Equivalent to one exact rhyme :meth:`search` per pair, but the keys
+        are fetched together and definitions are loaded in a single query.
+        """
+
+        matches: Dict[Tuple[int, str], List[SearchResult]] = {}
+        keys_by_syllables: Dict[int, List[str]] = {}
+        for syllables, key in keys:
+            cached = self._cached_results(
+                _exact_rhyme_options(key, syllables, part_of_speech, limit, include_definitions)
             )
-            results.append(result)
-        results.sort(key=self._result_sort_key)
-        limited = results if limit is None else results[:limit]
-        self._attach_definitions(limited)
-        return limited
+            if cached is not None:
+                matches[(syllables, key)] = _copy_results(cached)
+            else:
+                keys_by_syllables.setdefault(syllables, []).append(key)
+        rows = self.db.rhymes_by_keys(
+            keys_by_syllables, part_of_speech=part_of_speech, limit_per_key=limit
+        )
+        fetched = {
+            group: [self._result_from_row(row, 1.0) for row in group_rows]
+            for group, group_rows in rows.items()
+        }
+        if include_definitions:
+            self.attach_definitions([result for group in fetched.values() for result in group])
+        for (syllables, key), results in fetched.items():
+            self._remember(
+                _exact_rhyme_options(key, syllables, part_of_speech, limit, include_definitions),
+                results,
+            )
+            matches[(syllables, key)] = _copy_results(results)
+        return matches
+
+    def _syllable_index(self) -> SyllableIndex:
+        """Return the nucleus index over stored pronunciations, rebuilt after writes."""
+
+        generation = self.db.generation
+        if self._syllables is None or self._syllables_generation != generation:
+            self._syllables = SyllableIndex(self.db.distinct_sequences("pronunciation"))
+            self._syllables_generation = generation
+        return self._syllables
+
+    def _cached_results(self, options: SearchOptions) -> Optional[List[SearchResult]]:
+        generation = self.db.generation
+        if self._cache_generation != generation:
+            self._cache.clear()
+            self._cache_generation = generation
+        results = self._cache.get(options)
+        if results is not None:
+            self._cache.move_to_end(options)
+        return results
+
+    def _remember(self, options: SearchOptions, results: List[SearchResult]) -> None:
+        self._cache[options] = results
+        if len(self._cache) > _SEARCH_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _stress_patterns(self, pattern: Optional[str]) -> Optional[Set[Optional[str]]]:
+        """Return the stored stress patterns matching the glob ``pattern``.
+
+        Only a few distinct stress patterns exist, so each is matched once
+        and rows are then filtered by set membership. ``None`` stands for a
+        missing stress pattern, which matches like an empty one. Returns
+        ``None`` when every row is accepted.
+        """
+
+        if not pattern or _matches_everything(pattern):
+            return None
+        matcher = _compile_wildcard(pattern)
+        accepted: Set[Optional[str]] = {
+            value for value in self.db.distinct_sequences("stress_pattern") if matcher(value) is not None
+        }
+        if matcher("") is not None:
+            accepted.add(None)
+        return accepted
+
+    def _near_candidates(
+        self, options: SearchOptions, pattern_tokens: List[str]
+    ) -> Tuple[Optional[str], Optional[List[str]]]:
+        """Narrow a near-match scan to candidate sequences via the bigram index.
+
+        Each edit removes at most two of the pattern's phoneme bigrams, so a
+        sequence within ``k`` edits shares at least ``bigrams - 2k`` of them.
+        Returns ``(None, None)`` when that bound cannot prune and every row
+        has to be scanned.
+        """
+
+        column = self._sequence_column(options)
+        max_edits = _max_edits(options, len(pattern_tokens))
+        if column is None or max_edits is None:
+            return None, None
+        min_shared = len(set(zip(pattern_tokens, pattern_tokens[1:]))) - 2 * max_edits
+        if min_shared <= 0:
+            return None, None
+        values = self.db.sequences_by_qgrams(column, pattern_tokens, min_shared)
+        if len(values) > _MAX_CANDIDATE_SEQUENCES:
+            return None, None
+        return column, values
+
+    @staticmethod
+    def _is_exact_rhyme_lookup(options: SearchOptions) -> bool:
+        """Return ``True`` if ``options`` is a plain rhyme-key equality query."""
+
+        return (
+            options.pattern_type == "rhyme"
+            and bool(options.pattern)
+            and not options.regex
+            and not options.contains
+            and options.max_distance is None
+            and options.min_similarity is None
+            and not options.stress_pattern
+            and max(1, options.syllables) <= MAX_PRECOMPUTED_RHYME_KEY
+            and _WILDCARD_CHARS.isdisjoint(options.pattern or "")
+        )
+
+    @staticmethod
+    def _result_from_row(
+        row, score: Optional[float], match_span: Optional[Tuple[int, int]] = None
+    ) -> SearchResult:
+        return SearchResult(
+            word_id=row["word_id"],
+            word=row["word"],
+            pronunciation=row["pronunciation"],
+            syllable_count=row["syllable_count"],
+            stress_pattern=row["stress_pattern"],
+            similarity=score,
+            terminal_vowels=row["terminal_vowels"],
+            terminal_consonants=row["terminal_consonants"],
+            rhyme_key=row["rhyme_key_1"],
+            matched_syllables=match_span,
+        )
 
     @staticmethod
     def _result_sort_key(result: SearchResult) -> tuple:
@@ -163,38 +402,55 @@ class SearchEngine:
         return (-result.syllable_count, -score, result.word)
 
     # ------------------------------------------------------------------
-    def _sequence_from_row(self, row, options: SearchOptions) -> Optional[str]:
+    @staticmethod
+    def _sequence_column(options: SearchOptions) -> Optional[str]:
+        """Return the stored column that holds the sequence searched by ``options``."""
+
         syllables = max(1, options.syllables)
-        if options.pattern_type == "vowel":
-            return row["terminal_vowels"]
-        if options.pattern_type == "consonant":
-            return row["terminal_consonants"]
-        if options.pattern_type == "both":
-            return row["terminal_both"]
         if options.pattern_type == "rhyme":
-            if syllables <= MAX_PRECOMPUTED_RHYME_KEY:
-                column = f"rhyme_key_{syllables}"
-                return row[column]
-            pronunciation = Pronunciation(tuple(row["pronunciation"].split()))
-            return pronunciation.rhyme_key(syllables)
-        if options.pattern_type == "phonemes":
-            return row["pronunciation"]
-        return None
+            return f"rhyme_key_{syllables}" if syllables <= MAX_PRECOMPUTED_RHYME_KEY else None
+        return _SEQUENCE_COLUMNS.get(options.pattern_type)
 
-    def _matches_pattern(self, sequence: str | None, options: SearchOptions) -> bool:
-        if sequence is None:
-            return False
+    @classmethod
+    def _sequence_getter(
+        cls, options: SearchOptions, positions: Mapping[str, int]
+    ) -> Callable[[sqlite3.Row], Optional[str]]:
+        """Return a function reading the searched sequence from a row.
+
+        Resolved once per query so the per-row work is a single call with no
+        ``pattern_type`` dispatch. ``positions`` maps column names to their
+        index in the row.
+        """
+
+        column = cls._sequence_column(options)
+        if column is not None:
+            return itemgetter(positions[column])
+        syllables = max(1, options.syllables)
+        if options.pattern_type == "rhyme":
+            pronunciation_index = positions["pronunciation"]
+            return lambda row: rhyme_key_from_text(row[pronunciation_index], syllables)
+        return lambda row: None
+
+    def _compile_pattern(
+        self, options: SearchOptions
+    ) -> Optional[Callable[[str], Optional[re.Match[str]]]]:
+        """Return the matcher for ``options.pattern``, or ``None`` if it accepts anything."""
+
+        # Stored sequences are single-space separated, so they are matched
+        # as-is without re-normalizing whitespace.
+        pattern = options.pattern or ""
         if options.regex:
-            target = " ".join(sequence.split())
-            matcher = re.search if options.contains else re.fullmatch
-            return matcher(options.pattern, target) is not None
-        text = " ".join(sequence.split())
-        pattern = options.pattern
-        if options.contains and not any(ch in pattern for ch in "*?[]"):
+            compiled = re.compile(pattern)
+            return compiled.search if options.contains else compiled.fullmatch
+        if _matches_everything(pattern):
+            return None
+        if options.contains and not any(ch in pattern for ch in _WILDCARD_CHARS):
             pattern = f"*{pattern}*"
-        return fnmatch.fnmatchcase(text, pattern)
+        return _compile_wildcard(pattern)
+
+    def attach_definitions(self, results: Iterable[SearchResult]) -> None:
+        """Load definitions for ``results`` with a single query and attach them."""
 
-    def _attach_definitions(self, results: Sequence[SearchResult]) -> None:
         unique_ids = []
         index_map = {}
         for result in results:
@@ -208,27 +464,69 @@ class SearchEngine:
                 result.definitions = defs
 
 
-def _edit_distance(sequence: str, pattern: str) -> int:
+def _exact_rhyme_options(
+    key: str,
+    syllables: int,
+    part_of_speech: Optional[str],
+    limit: Optional[int],
+    include_definitions: bool,
+) -> SearchOptions:
+    return SearchOptions(
+        pattern=key,
+        syllables=syllables,
+        part_of_speech=part_of_speech,
+        limit=limit,
+        include_definitions=include_definitions,
+    )
+
+
+def _copy_results(results: Iterable[SearchResult]) -> List[SearchResult]:
+    """Return copies of cached ``results`` that callers can modify safely."""
+
+    return [replace(result, definitions=list(result.definitions)) for result in results]
+
+
+def _max_edits(options: SearchOptions, pattern_length: int) -> Optional[int]:
+    """Return the most edits a near match of ``options`` may need, if bounded."""
+
+    if options.max_distance is not None:
+        return options.max_distance
+    if options.min_similarity is None or options.min_similarity <= 0:
+        return None
+    # Matches are at most ``pattern_length / min_similarity`` tokens long.
+    min_similarity = options.min_similarity
+    return math.floor((1.0 - min_similarity) * pattern_length / min_similarity + 1e-9)
+
+
+def _near_score(
+    sequence: str,
+    pattern_tokens: List[str],
+    options: SearchOptions,
+    distance: Callable[[Sequence[str], Optional[int]], int],
+) -> Optional[float]:
+    """Return the near-match score of a sequence, or ``None`` if it is rejected.
+
+    ``distance`` is :func:`distance_from` applied to ``pattern_tokens``.
+    """
+
+    if options.max_distance is not None:
+        # Stored sequences are single-space separated, so the token count is
+        # known without splitting; the edit distance is at least the length
+        # difference.
+        length = sequence.count(" ") + 1 if sequence else 0
+        if abs(length - len(pattern_tokens)) > options.max_distance:
+            return None
+        seq_tokens = sequence.split()
+        edits = distance(seq_tokens, options.max_distance)
+        if edits > options.max_distance:
+            return None
+        return 1.0 - edits / max(len(seq_tokens), len(pattern_tokens), 1)
+    assert options.min_similarity is not None
     seq_tokens = sequence.split()
-    pattern_tokens = tokens(pattern)
-    return _levenshtein(seq_tokens, pattern_tokens)
-
-
-def _levenshtein(left: Sequence[str], right: Sequence[str]) -> int:
-    if left == right:
-        return 0
-    if not left:
-        return len(right)
-    if not right:
-        return len(left)
-    previous = list(range(len(right) + 1))
-    for i, token in enumerate(left, start=1):
-        row = [i]
-        for j, other in enumerate(right, start=1):
-            cost = 0 if token == other else 1
-            row.append(min(row[-1] + 1, previous[j] + 1, previous[j - 1] + cost))
-        previous = row
-    return previous[-1]
+    score = similarity(pattern_tokens, seq_tokens, options.min_similarity, distance=distance)
+    if score < options.min_similarity:
+        return None
+    return score
 
 
 def match_wildcard(text: str, pattern: str) -> bool:
@@ -236,5 +534,20 @@ def match_wildcard(text: str, pattern: str) -> bool:
 
     if not pattern:
         return True
-    return fnmatch.fnmatchcase(text, pattern)
+    return _compile_wildcard(pattern)(text) is not None
+
+
+def _matches(matcher: Callable[[str], Optional[re.Match[str]]]) -> Callable[[str], bool]:
+    return lambda text: matcher(text) is not None
+
+
+def _matches_everything(pattern: str) -> bool:
+    """Return ``True`` if the glob ``pattern`` is only ``*`` wildcards."""
+
+    return bool(pattern) and not pattern.strip("*")
+
+
+@lru_cache(maxsize=1024)
+def _compile_wildcard(pattern: str) -> Callable[[str], Optional[re.Match[str]]]:
+    return re.compile(fnmatch.translate(pattern)).match
 
@@ -2,18 +2,39 @@
 from __future__ import annotations
 
 import fnmatch
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Iterator, List, Optional, Sequence, Tuple, Union
-
-from .phonetics import is_vowel, strip_stress, tokens
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .phonetics import (
+    ARPABET_VOWELS,
+    intern_phonemes,
+    phoneme_stress,
+    phoneme_stresses,
+    strip_stress,
+)
 
 # ---------------------------------------------------------------------------
 # Syllable representation
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Syllable:
     """Structured view of a syllable within a pronunciation."""
 
@@ -24,11 +45,11 @@ class Syllable:
 
     @property
     def onset_text(self) -> str:
-        return " ".join(self.onset)
+        return _cluster_text(self.onset)
 
     @property
     def coda_text(self) -> str:
-        return " ".join(self.coda)
+        return _cluster_text(self.coda)
 
     @property
     def vowel(self) -> str:
@@ -39,6 +60,13 @@ class Syllable:
         return strip_stress(self.nucleus)
 
 
+@lru_cache(maxsize=4096)
+def _cluster_text(cluster: Tuple[str, ...]) -> str:
+    # Syllables are frozen and slotted, so the joined text cannot be cached on
+    # the instance; consonant clusters repeat heavily, so memoize it here.
+    return " ".join(cluster)
+
+
 # ---------------------------------------------------------------------------
 # Syllable segmentation
 # ---------------------------------------------------------------------------
@@ -117,139 +145,250 @@ _CLUSTER_ONSETS = {
 
 _ALLOWED_ONSETS: set[Tuple[str, ...]] = {(c,) for c in _SINGLE_ONSETS}
 _ALLOWED_ONSETS.update(_CLUSTER_ONSETS)
+_MAX_ONSET_LENGTH = max(len(onset) for onset in _ALLOWED_ONSETS)
 
 
 def syllabify(pronunciation: Sequence[str] | str) -> List[Syllable]:
     """Split a pronunciation into syllables."""
 
+    # Tokens are drawn from the shared phoneme pool so syllables reuse one
+    # string object per phoneme and equality checks short-circuit on identity.
     if isinstance(pronunciation, str):
-        phonemes = tuple(tokens(pronunciation))
-    else:
-        phonemes = tuple(pronunciation)
-    return list(_syllabify_cached(phonemes))
+        return list(_syllabify_text(pronunciation))
+    return list(_syllabify_cached(tuple(intern_phonemes(pronunciation))))
+
+
+# Syllabification is read-mostly, so a plain dict replaces ``lru_cache``: a
+# hit is one lookup with no recency bookkeeping. Keys are tuples of pooled
+# phoneme strings, whose hashes are cached on the string objects. When the
+# cache grows past its cap the oldest entries are dropped in one batch. The
+# cap covers every pronunciation in CMUdict so a full lexicon pass never
+# evicts its own entries.
+_SYLLABLE_CACHE: Dict[Tuple[str, ...], Tuple[Syllable, ...]] = {}
+_SYLLABLE_CACHE_SIZE = 200_000
+_SYLLABLE_CACHE_EVICT = 8192
+
+
+def clear_syllabify_cache() -> None:
+    """Release the syllabifications cached by :func:`syllabify` and :func:`syllabify_many`."""
+
+    _SYLLABLE_CACHE.clear()
+    _TEXT_SYLLABLE_CACHE.clear()
 
 
-@lru_cache(maxsize=8192)
 def _syllabify_cached(phonemes: Tuple[str, ...]) -> Tuple[Syllable, ...]:
+    cache = _SYLLABLE_CACHE
+    try:
+        return cache[phonemes]
+    except KeyError:
+        pass
+    syllables = _syllabify_phonemes(phonemes)
+    if len(cache) >= _SYLLABLE_CACHE_SIZE:
+        for key in list(islice(cache, _SYLLABLE_CACHE_EVICT)):
+            del cache[key]
+    cache[phonemes] = syllables
+    return syllables
+
+
+def syllabify_many(pronunciations: Iterable[str]) -> Iterator[Tuple[Syllable, ...]]:
+    """Yield the syllables of each space separated pronunciation string.
+
+    Bulk counterpart of :func:`syllabify` for passes over a lexicon. Results
+    are cached per pronunciation string, so a repeated pronunciation costs
+    one dict lookup without re-tokenizing.
+    """
+
+    return map(_syllabify_text, pronunciations)
+
+
+_TEXT_SYLLABLE_CACHE: Dict[str, Tuple[Syllable, ...]] = {}
+
+
+def _syllabify_text(text: str) -> Tuple[Syllable, ...]:
+    cache = _TEXT_SYLLABLE_CACHE
+    try:
+        return cache[text]
+    except KeyError:
+        pass
+    syllables = _syllabify_cached(tuple(intern_phonemes(text.split())))
+    if len(cache) >= _SYLLABLE_CACHE_SIZE:
+        for key in list(islice(cache, _SYLLABLE_CACHE_EVICT)):
+            del cache[key]
+    cache[text] = syllables
+    return syllables
+
+
+def _syllabify_phonemes(phonemes: Tuple[str, ...]) -> Tuple[Syllable, ...]:
+    # Onsets and codas are slices of the phoneme tuple, so each syllable is
+    # built once with no intermediate buffers. Consonants before the first
+    # vowel form the first onset and those after the last vowel the last coda.
+    # One table lookup per phoneme yields both the vowel test and the stress.
+    stresses = phoneme_stresses(phonemes)
+    vowels = [index for index, stress in enumerate(stresses) if stress]
     syllables: List[Syllable] = []
-    current_onset: List[str] = []
-    i = 0
-    length = len(phonemes)
-    while i < length:
-        phoneme = phonemes[i]
-        if is_vowel(phoneme):
-            nucleus = phoneme
-            stress = phoneme[-1] if phoneme[-1].isdigit() else "0"
-            # gather consonants until next vowel
-            j = i + 1
-            buffer: List[str] = []
-            while j < length and not is_vowel(phonemes[j]):
-                buffer.append(phonemes[j])
-                j += 1
-            next_vowel_exists = j < length
-            coda, next_onset = _split_cluster(buffer, next_vowel_exists)
-            syllables.append(
-                Syllable(onset=tuple(current_onset), nucleus=nucleus, coda=tuple(coda), stress=stress)
-            )
-            current_onset = next_onset
-            i = j
+    onset_start = 0
+    for position, index in enumerate(vowels):
+        nucleus = phonemes[index]
+        if position + 1 < len(vowels):
+            cluster_start = index + 1
+            split = cluster_start + _onset_split(phonemes[cluster_start : vowels[position + 1]])
         else:
-            current_onset.append(phoneme)
-            i += 1
-    # Any trailing onset consonants become part of the last coda
-    if current_onset and syllables:
-        last = syllables[-1]
-        merged_coda = last.coda + tuple(current_onset)
-        syllables[-1] = Syllable(onset=last.onset, nucleus=last.nucleus, coda=merged_coda, stress=last.stress)
+            split = len(phonemes)
+        syllables.append(
+            Syllable(
+                onset=phonemes[onset_start:index],
+                nucleus=nucleus,
+                coda=phonemes[index + 1 : split],
+                stress=stresses[index],
+            )
+        )
+        onset_start = split
     return tuple(syllables)
 
 
-def _split_cluster(cluster: List[str], allow_onset: bool) -> Tuple[List[str], List[str]]:
+@lru_cache(maxsize=4096)
+def _onset_split(cluster: Tuple[str, ...]) -> int:
+    """Return where the consonants between two vowels split into coda and onset."""
+
     if not cluster:
-        return [], []
-    if not allow_onset:
-        return list(cluster), []
-    for index in range(len(cluster)):
-        suffix = tuple(cluster[index:])
-        if suffix in _ALLOWED_ONSETS:
-            return cluster[:index], list(suffix)
+        return 0
+    # Longest suffix first (maximal onset); longer suffixes cannot be onsets.
+    for index in range(max(0, len(cluster) - _MAX_ONSET_LENGTH), len(cluster)):
+        if cluster[index:] in _ALLOWED_ONSETS:
+            return index
     # default: keep final consonant as onset of next syllable
-    return cluster[:-1], [cluster[-1]]
+    return len(cluster) - 1
 
 
 # ---------------------------------------------------------------------------
 # Pattern parsing and matching
 # ---------------------------------------------------------------------------
 
+_GLOB_CHARS = frozenset("*?[")
+
+# Translation tables so separator handling is a single C-level pass.
+_STRESS_CHARS_DELETE = str.maketrans("", "", "012PpSsUu|, ")
+_STRESS_SEPARATORS_DELETE = str.maketrans("", "", ",|")
+_COMPONENT_SEPARATORS = str.maketrans("_.+", "   ")
+_VOWEL_OPTION_SEPARATORS = str.maketrans("|,_.+", "     ")
+
+# Every nucleus spelling CMUdict produces: each vowel bare and with a stress.
+_KNOWN_NUCLEI = frozenset(
+    vowel + stress for vowel in ARPABET_VOWELS for stress in ("", "0", "1", "2")
+)
+
 _EMPTY_MARKERS = {"", "Ø", "ø", "0", "NONE", "none", "NULL", "null"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _TokenPattern:
     kind: str
     values: Tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComponentPattern:
     tokens: Optional[Tuple[_TokenPattern, ...]] = None
     require_empty: bool = False
+    _predicate: Callable[[Tuple[str, ...]], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_predicate", _compile_component_predicate(self))
 
     def matches(self, cluster: Sequence[str]) -> bool:
-        if self.require_empty:
-            return len(cluster) == 0
-        if self.tokens is None:
-            return True
-        return _match_token_pattern(self.tokens, tuple(cluster))
+        return self._predicate(cluster if isinstance(cluster, tuple) else tuple(cluster))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VowelPattern:
     options: Tuple[str, ...]
+    _any: bool = field(init=False, repr=False, compare=False)
+    _accepted: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _predicate: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Literal options are accepted by set membership; glob options are
+        # folded into one regex, translated once per pattern. The nucleus
+        # alphabet is closed, so the regex is also evaluated once per known
+        # nucleus and matching those becomes a set lookup too.
+        literals = frozenset(option for option in self.options if not _GLOB_CHARS & set(option))
+        globs = [option for option in self.options if option not in literals]
+        matcher: Optional[Callable[[str], Optional[re.Match[str]]]] = None
+        accepted = literals
+        if globs:
+            matcher = re.compile("|".join(f"(?:{fnmatch.translate(glob)})" for glob in globs)).match
+            accepted |= frozenset(vowel for vowel in _KNOWN_NUCLEI if matcher(vowel) is not None)
+        object.__setattr__(self, "_any", "*" in self.options)
+        object.__setattr__(self, "_accepted", accepted)
+        if self._any:
+            object.__setattr__(self, "_predicate", lambda vowel: True)
+        else:
+            object.__setattr__(self, "_predicate", _compile_vowel_predicate(matcher, accepted))
 
     def matches(self, vowel: str) -> bool:
-        return any(fnmatch.fnmatchcase(vowel, option) for option in self.options)
+        return self._predicate(vowel)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyllablePattern:
     onset: ComponentPattern
     vowel: VowelPattern
     coda: ComponentPattern
-    stress: Optional[set[str]] = None
+    stress: Optional[FrozenSet[str]] = None
+    _strict: Callable[[Syllable], bool] = field(init=False, repr=False, compare=False)
+    _loose: Callable[[Syllable], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_loose", _compile_syllable_predicate(self, None))
+        object.__setattr__(self, "_strict", _compile_syllable_predicate(self, self.stress))
 
     def matches(self, syllable: Syllable, *, ignore_stress: bool = False) -> bool:
-        if not self.onset.matches(syllable.onset):
-            return False
-        if not self.vowel.matches(syllable.vowel):
-            return False
-        if not self.coda.matches(syllable.coda):
-            return False
-        if ignore_stress or self.stress is None:
-            return True
-        return syllable.stress in self.stress
+        return self.compile(ignore_stress=ignore_stress)(syllable)
+
+    def compile(self, *, ignore_stress: bool = False) -> Callable[[Syllable], bool]:
+        """Return the precompiled predicate equivalent to :meth:`matches`."""
+
+        return self._loose if ignore_stress else self._strict
 
+    def accepts_nucleus(self, nucleus: str, *, ignore_stress: bool = False) -> bool:
+        """Return ``True`` if a syllable with ``nucleus`` could match this pattern."""
+
+        if not ignore_stress and self.stress is not None:
+            if phoneme_stress(nucleus) not in self.stress:
+                return False
+        return self.vowel.matches(nucleus)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class WildcardSyllable:
     """Wildcard that matches any single syllable."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WildcardSequence:
     """Wildcard that matches zero or more syllables."""
 
 
 PatternElement = Union[SyllablePattern, WildcardSyllable, WildcardSequence]
 
+_T = TypeVar("_T")
+
 
 def parse_syllable_pattern(pattern: str) -> List[PatternElement]:
     """Parse a multi-syllable pattern string."""
 
+    return list(_parse_syllable_pattern_cached(pattern))
+
+
+@lru_cache(maxsize=1024)
+def _parse_syllable_pattern_cached(pattern: str) -> Tuple[PatternElement, ...]:
+    # Parsed elements are immutable, so repeated queries share them.
     tokens = _tokenize(pattern)
     syllables: List[PatternElement] = []
     for token in tokens:
-        stress_values: Optional[set[str]] = None
+        stress_values: Optional[FrozenSet[str]] = None
         core = token.strip()
         if not core:
             raise ValueError("Empty syllable pattern segment")
@@ -263,7 +402,7 @@ def parse_syllable_pattern(pattern: str) -> List[PatternElement]:
             raise ValueError(f"Invalid syllable pattern '{token}': missing '-' separator")
         onset_text, remainder = core.split("-", 1)
         onset = _parse_component(onset_text, allow_wildcard=True)
-        coda = ComponentPattern(tokens=None, require_empty=False)
+        coda = _canonical(ComponentPattern, None, False)
         vowel_text = remainder
         if "/" in remainder:
             vowel_text, coda_text = remainder.split("/", 1)
@@ -273,14 +412,54 @@ def parse_syllable_pattern(pattern: str) -> List[PatternElement]:
             raise ValueError(f"Invalid syllable pattern '{token}': missing vowel specification")
         vowel_text, stress_values = _separate_stress_block(vowel_text)
         syllables.append(
-            SyllablePattern(
-                onset=onset,
-                vowel=_parse_vowel_pattern(vowel_text),
-                coda=coda,
-                stress=stress_values,
-            )
+            _canonical(SyllablePattern, onset, _parse_vowel_pattern(vowel_text), coda, stress_values)
         )
-    return syllables
+    return tuple(syllables)
+
+
+class SyllableIndex:
+    """Inverted index from syllable nucleus to the pronunciations containing it.
+
+    Every non-wildcard element of a pattern must match its own syllable, so a
+    pronunciation can only match if, for each element, it contains a nucleus
+    that the element accepts. :meth:`candidates` applies that test to whole
+    posting lists instead of matching pronunciations one by one.
+    """
+
+    def __init__(self, pronunciations: Iterable[str]):
+        self._by_nucleus: Dict[str, Set[str]] = {}
+        pronunciations = list(pronunciations)
+        for text, syllables in zip(pronunciations, syllabify_many(pronunciations)):
+            for syllable in syllables:
+                self._by_nucleus.setdefault(syllable.nucleus, set()).add(text)
+
+    def candidates(
+        self, pattern: Sequence[PatternElement], *, ignore_stress: bool = False
+    ) -> Optional[Set[str]]:
+        """Return the pronunciations that may match ``pattern``.
+
+        ``None`` means the index cannot narrow the search (for example a
+        pattern made only of wildcards).
+        """
+
+        result: Optional[Set[str]] = None
+        for element in pattern:
+            if not isinstance(element, SyllablePattern):
+                continue
+            nuclei = [
+                nucleus
+                for nucleus in self._by_nucleus
+                if element.accepts_nucleus(nucleus, ignore_stress=ignore_stress)
+            ]
+            if len(nuclei) == len(self._by_nucleus):
+                continue  # accepts every syllable; no pruning possible
+            matched: Set[str] = set()
+            for nucleus in nuclei:
+                matched |= self._by_nucleus[nucleus]
+            result = matched if result is None else result & matched
+            if not result:
+                break
+        return result
 
 
 def find_syllable_matches(
@@ -292,57 +471,9 @@ def find_syllable_matches(
 ) -> List[Tuple[int, int]]:
     """Return the start/end indices of matches for ``pattern`` within ``syllables``."""
 
-    if not pattern:
-        return [(0, 0)] if not syllables else [(0, len(syllables))]
-    matches: List[Tuple[int, int]] = []
-
-    @lru_cache(maxsize=None)
-    def _match(start: int, index: int) -> Tuple[int, ...]:
-        if index == len(pattern):
-            return (start,)
-        token = pattern[index]
-        results: List[int] = []
-        if isinstance(token, WildcardSequence):
-            # Allow the wildcard sequence to consume zero syllables before
-            # exploring longer spans. This preserves the intended "zero or
-            # more" semantics without requiring callers to add an explicit
-            # single-syllable wildcard to cover the empty case.
-            results.extend(_match(start, index + 1))
-            for next_start in range(start + 1, len(syllables) + 1):
-                results.extend(_match(next_start, index + 1))
-            return tuple(dict.fromkeys(results))
-        if start >= len(syllables):
-            return tuple()
-        if isinstance(token, WildcardSyllable):
-            return _match(start + 1, index + 1)
-        if token.matches(syllables[start], ignore_stress=ignore_stress):
-            return _match(start + 1, index + 1)
-        return tuple()
-
-    candidate_starts: Iterator[int]
-    if contains:
-        candidate_starts = iter(range(0, len(syllables) + 1))
-    else:
-        candidate_starts = iter((0,))
-    for start in candidate_starts:
-        for end in _match(start, 0):
-            if not contains and start != 0:
-                continue
-            if not contains and end != len(syllables):
-                continue
-            if end < start:
-                continue
-            if end > len(syllables):
-                continue
-            matches.append((start, end))
-    # Remove duplicates while preserving order
-    unique: List[Tuple[int, int]] = []
-    seen = set()
-    for match in matches:
-        if match not in seen:
-            seen.add(match)
-            unique.append(match)
-    return unique
+    return CompiledSyllablePattern(pattern, ignore_stress=ignore_stress).find(
+        syllables, contains=contains
+    )
 
 
 def matches_syllable_pattern(
@@ -354,34 +485,186 @@ def matches_syllable_pattern(
 ) -> bool:
     """Return ``True`` if ``pattern`` matches ``syllables``."""
 
-    return bool(find_syllable_matches(syllables, pattern, contains=contains, ignore_stress=ignore_stress))
+    return CompiledSyllablePattern(pattern, ignore_stress=ignore_stress).matches(
+        syllables, contains=contains
+    )
+
+
+class CompiledSyllablePattern:
+    """A parsed pattern specialised once for matching many pronunciations.
+
+    :func:`find_syllable_matches` builds one of these per call; callers that
+    test the same pattern against many words should build it themselves.
+    """
+
+    __slots__ = ("_predicates", "_required", "_whole")
+
+    def __init__(self, pattern: Sequence[PatternElement], *, ignore_stress: bool = False):
+        # ``bool`` accepts any syllable, standing in for ``*``, and ``None``
+        # marks ``**``, which is handled structurally by :meth:`_ends`.
+        predicates: List[Optional[Callable[[Syllable], bool]]] = []
+        for token in pattern:
+            if isinstance(token, SyllablePattern):
+                predicates.append(token.compile(ignore_stress=ignore_stress))
+            elif isinstance(token, WildcardSequence):
+                predicates.append(None)
+            else:
+                predicates.append(bool)
+        self._predicates = tuple(predicates)
+        # Every element except ``**`` consumes exactly one syllable.
+        self._required = len(predicates) - predicates.count(None)
+        self._whole = _compile_whole_word_matcher(self._predicates)
+
+    def find(self, syllables: Sequence[Syllable], *, contains: bool = False) -> List[Tuple[int, int]]:
+        """Return the start/end indices of matches within ``syllables``."""
+
+        if not self._predicates:
+            return [(0, 0)] if not syllables else [(0, len(syllables))]
+        if not contains and self._whole is not None:
+            return [(0, len(syllables))] if self._whole(syllables) else []
+        matches: List[Tuple[int, int]] = []
+        for start, reachable in enumerate(self._ends(syllables, contains)):
+            while reachable:
+                lowest = reachable & -reachable
+                matches.append((start, lowest.bit_length() - 1))
+                reachable ^= lowest
+        return matches
+
+    def first(
+        self, syllables: Sequence[Syllable], *, contains: bool = False
+    ) -> Optional[Tuple[int, int]]:
+        """Return the first span :meth:`find` would report, or ``None``."""
+
+        if not self._predicates:
+            return (0, len(syllables))
+        if not contains and self._whole is not None:
+            return (0, len(syllables)) if self._whole(syllables) else None
+        for start, reachable in enumerate(self._ends(syllables, contains)):
+            if reachable:
+                return (start, (reachable & -reachable).bit_length() - 1)
+        return None
+
+    def matches(self, syllables: Sequence[Syllable], *, contains: bool = False) -> bool:
+        """Return ``True`` if the pattern matches ``syllables``."""
+
+        if not self._predicates:
+            return True
+        if not contains and self._whole is not None:
+            return self._whole(syllables)
+        return any(self._ends(syllables, contains))
+
+    def _ends(self, syllables: Sequence[Syllable], contains: bool) -> List[int]:
+        """Return, for each candidate start, a bitmask of the ends of its matches.
+
+        Only start 0 and the end after the last syllable are candidates unless
+        ``contains`` is set.
+        """
+
+        size = len(syllables)
+        predicates = self._predicates
+        required = self._required
+        # The required length bounds the spans worth trying before any
+        # syllable is inspected.
+        if required > size:
+            return []
+        # ends[s] is a bitmask of the positions where the pattern from the
+        # current element on can finish when started at syllable s; rows are
+        # filled from the last element back.
+        ends = [1 << start for start in range(size + 1)]
+        for predicate in reversed(predicates):
+            if predicate is None:
+                # Zero or more syllables: finish where the rest finishes from
+                # here or from any later start.
+                for start in range(size - 1, -1, -1):
+                    ends[start] |= ends[start + 1]
+                continue
+            row = [0] * (size + 1)
+            for start in range(size):
+                following = ends[start + 1]
+                if following and predicate(syllables[start]):
+                    row[start] = following
+            ends = row
+        if not contains:
+            return [ends[0] & 1 << size]
+        return ends[: size - required + 1]
+
+
+def _compile_whole_word_matcher(
+    predicates: Sequence[Optional[Callable[[Syllable], bool]]]
+) -> Optional[Callable[[Sequence[Syllable]], bool]]:
+    """Return a matcher for whole words against a pattern without ``**``.
+
+    Such a pattern pairs each element with one syllable, so the match is a
+    length check followed by each element's predicate applied in turn; ``*``
+    elements are skipped. Returns ``None`` for patterns containing ``**``.
+    """
+
+    if None in predicates:
+        return None
+    size = len(predicates)
+    # ``bool`` stands in for ``*``, which accepts any syllable.
+    checks = tuple(
+        (position, predicate) for position, predicate in enumerate(predicates) if predicate is not bool
+    )
+
+    def matches(syllables: Sequence[Syllable]) -> bool:
+        if len(syllables) != size:
+            return False
+        for position, predicate in checks:
+            if not predicate(syllables[position]):
+                return False
+        return True
+
+    return matches
+
+
+# Tokenizers only need to look at brackets and whitespace; the regex engine
+# skips over everything else so Python handles a few events per token.
+_PATTERN_EVENTS = re.compile(r"[()\[\]]|\s+")
+_COMPONENT_EVENTS = re.compile(r"[\[\]]|\s+")
+
+
+@lru_cache(maxsize=4096)
+def _canonical(cls: Callable[..., _T], *fields: object) -> _T:
+    """Return the shared instance of pattern class ``cls`` built from ``fields``.
+
+    Equal pattern elements parsed from different pattern strings resolve to
+    one object, so their regexes and predicates are compiled only once.
+    """
+
+    return cls(*fields)
 
 
 def _tokenize(pattern: str) -> List[str]:
+    return _split_top_level(pattern.strip(), _PATTERN_EVENTS, f"pattern '{pattern}'")
+
+
+def _split_top_level(text: str, events: re.Pattern[str], source: str) -> List[str]:
+    """Split ``text`` on whitespace that is not nested inside brackets."""
+
     tokens: List[str] = []
-    current: List[str] = []
     depth = 0
-    for char in pattern.strip():
+    start = 0
+    for event in events.finditer(text):
+        char = event.group()
         if char in "([":
             depth += 1
         elif char in ")]":
             if depth == 0:
-                raise ValueError(f"Unmatched closing bracket in pattern '{pattern}'")
+                raise ValueError(f"Unmatched closing bracket in {source}")
             depth -= 1
-        if char.isspace() and depth == 0:
-            if current:
-                tokens.append("".join(current))
-                current = []
-        else:
-            current.append(char)
-    if current:
-        tokens.append("".join(current))
+        elif depth == 0:
+            if event.start() > start:
+                tokens.append(text[start : event.start()])
+            start = event.end()
     if depth != 0:
-        raise ValueError(f"Unmatched opening bracket in pattern '{pattern}'")
+        raise ValueError(f"Unmatched opening bracket in {source}")
+    if start < len(text):
+        tokens.append(text[start:])
     return tokens
 
 
-def _separate_stress_block(text: str) -> Tuple[str, Optional[set[str]]]:
+def _separate_stress_block(text: str) -> Tuple[str, Optional[FrozenSet[str]]]:
     stripped = text.strip()
     if not stripped:
         raise ValueError("Vowel component cannot be empty")
@@ -417,13 +700,12 @@ def _find_matching_open(text: str, opening: str, closing: str) -> Optional[int]:
 
 
 def _looks_like_stress(value: str) -> bool:
-    allowed = set("012PpSsUu|, ")
-    return all(char in allowed for char in value)
+    return not value.translate(_STRESS_CHARS_DELETE)
 
 
-def _parse_stress_spec(spec: str) -> Optional[set[str]]:
+def _parse_stress_spec(spec: str) -> Optional[FrozenSet[str]]:
     allowed: set[str] = set()
-    for symbol in spec.replace(",", "").replace("|", ""):
+    for symbol in spec.translate(_STRESS_SEPARATORS_DELETE):
         if symbol in "012":
             allowed.add(symbol)
         elif symbol in "Pp":
@@ -438,23 +720,25 @@ def _parse_stress_spec(spec: str) -> Optional[set[str]]:
             raise ValueError(f"Unknown stress marker '{symbol}' in stress specification '{spec}'")
     if not allowed:
         return None
-    return allowed
+    return frozenset(allowed)
 
 
+@lru_cache(maxsize=1024)
 def _parse_component(text: str, allow_wildcard: bool) -> ComponentPattern:
     raw = text.strip()
     if not raw:
-        return ComponentPattern(tokens=None, require_empty=True)
+        return _canonical(ComponentPattern, None, True)
     cleaned = _strip_brackets(raw)
     normalized = _normalize_component_text(cleaned)
     if normalized.upper() in _EMPTY_MARKERS:
-        return ComponentPattern(tokens=None, require_empty=True)
+        return _canonical(ComponentPattern, None, True)
     if not allow_wildcard and normalized == "*":
         raise ValueError("'*' is not allowed for onset components; use explicit phonemes or omit the onset")
     token_pattern = _compile_component_pattern(normalized)
-    return ComponentPattern(tokens=token_pattern)
+    return _canonical(ComponentPattern, token_pattern, False)
 
 
+@lru_cache(maxsize=1024)
 def _parse_vowel_pattern(text: str) -> VowelPattern:
     raw = text.strip()
     if not raw:
@@ -468,18 +752,11 @@ def _parse_vowel_pattern(text: str) -> VowelPattern:
             options.append(normalized)
     if not options:
         raise ValueError(f"Invalid vowel specification '{text}'")
-    return VowelPattern(tuple(options))
+    return _canonical(VowelPattern, tuple(options))
 
 
 def _split_vowel_options(text: str) -> List[str]:
-    normalized = (
-        text.replace("|", " ")
-        .replace(",", " ")
-        .replace("_", " ")
-        .replace(".", " ")
-        .replace("+", " ")
-    )
-    return [piece for piece in normalized.split() if piece]
+    return text.translate(_VOWEL_OPTION_SEPARATORS).split()
 
 
 def _normalize_vowel_option(option: str) -> str:
@@ -506,9 +783,7 @@ def _strip_brackets(text: str) -> str:
 
 
 def _normalize_component_text(text: str) -> str:
-    cleaned = text.replace("_", " ").replace(".", " ").replace("+", " ")
-    parts = cleaned.strip().split()
-    return " ".join(parts)
+    return " ".join(text.translate(_COMPONENT_SEPARATORS).split())
 
 
 def _compile_component_pattern(text: str) -> Tuple[_TokenPattern, ...]:
@@ -523,36 +798,14 @@ def _compile_component_pattern(text: str) -> Tuple[_TokenPattern, ...]:
             compiled.append(_TokenPattern("any"))
         elif token.startswith("[") and token.endswith("]"):
             choices = _parse_choice_block(token)
-            compiled.append(_TokenPattern("set", choices))
+            compiled.append(_TokenPattern("set", tuple(intern_phonemes(choices))))
         else:
-            compiled.append(_TokenPattern("literal", (token,)))
+            compiled.append(_TokenPattern("literal", tuple(intern_phonemes((token,)))))
     return tuple(compiled)
 
 
 def _split_component_tokens(text: str) -> List[str]:
-    tokens: List[str] = []
-    current: List[str] = []
-    depth = 0
-    for char in text:
-        if char == "[":
-            depth += 1
-            current.append(char)
-        elif char == "]":
-            if depth == 0:
-                raise ValueError(f"Unmatched closing bracket in component '{text}'")
-            depth -= 1
-            current.append(char)
-        elif char.isspace() and depth == 0:
-            if current:
-                tokens.append("".join(current))
-                current = []
-        else:
-            current.append(char)
-    if depth != 0:
-        raise ValueError(f"Unmatched opening bracket in component '{text}'")
-    if current:
-        tokens.append("".join(current))
-    return [token for token in (token.strip() for token in tokens) if token]
+    return _split_top_level(text, _COMPONENT_EVENTS, f"component '{text}'")
 
 
 def _parse_choice_block(token: str) -> Tuple[str, ...]:
@@ -597,37 +850,135 @@ def _parse_choice_block(token: str) -> Tuple[str, ...]:
     return (inner,)
 
 
-def _match_token_pattern(pattern: Sequence[_TokenPattern], cluster: Sequence[str]) -> bool:
-    def _match(pi: int, ci: int) -> bool:
-        while pi < len(pattern):
-            part = pattern[pi]
-            if part.kind == "star":
-                # Collapse consecutive stars for efficiency
-                while pi + 1 < len(pattern) and pattern[pi + 1].kind == "star":
-                    pi += 1
-                next_index = pi + 1
-                if next_index == len(pattern):
-                    return True
-                for skip in range(ci, len(cluster) + 1):
-                    if _match(next_index, skip):
-                        return True
-                return False
-            if ci >= len(cluster):
+def _compile_component_predicate(component: ComponentPattern) -> Callable[[Tuple[str, ...]], bool]:
+    """Specialise a component pattern into a predicate on a cluster tuple."""
+
+    if component.require_empty:
+        return lambda cluster: not cluster
+    parts = component.tokens
+    if parts is None:
+        return lambda cluster: True
+    kinds = {part.kind for part in parts}
+    if kinds <= {"literal"}:
+        expected = tuple(part.values[0] for part in parts)
+        return lambda cluster: cluster == expected
+    if len(parts) == 1 and parts[0].kind == "set":
+        choices = frozenset(parts[0].values)
+        return lambda cluster: len(cluster) == 1 and cluster[0] in choices
+    if "star" not in kinds:
+        # Fixed length: check each position against its allowed tokens.
+        slots = tuple(None if part.kind == "any" else frozenset(part.values) for part in parts)
+        size = len(slots)
+
+        def _fixed(cluster: Tuple[str, ...]) -> bool:
+            if len(cluster) != size:
                 return False
-            token = cluster[ci]
-            if part.kind == "literal":
-                if token != part.values[0]:
+            for token, allowed in zip(cluster, slots):
+                if allowed is not None and token not in allowed:
                     return False
-            elif part.kind == "any":
-                pass
-            elif part.kind == "set":
-                if token not in part.values:
-                    return False
-            else:
-                raise ValueError(f"Unknown token pattern kind '{part.kind}'")
-            pi += 1
-            ci += 1
-        return ci == len(cluster)
+            return True
+
+        return _fixed
+    stars, allowed = _token_slots(parts)
+    return lambda cluster: _match_slots(stars, allowed, cluster)
+
 
-    return _match(0, 0)
+def _compile_syllable_predicate(
+    pattern: SyllablePattern, stress: Optional[FrozenSet[str]]
+) -> Callable[[Syllable], bool]:
+    """Combine the checks ``pattern`` makes on a syllable into one predicate.
+
+    The stress and nucleus checks run first, as they are the cheapest and
+    most selective.
+    """
+
+    vowel = pattern.vowel._predicate
+    onset = pattern.onset._predicate
+    coda = pattern.coda._predicate
+    if stress is None:
+        return lambda syllable: (
+            vowel(syllable.nucleus) and onset(syllable.onset) and coda(syllable.coda)
+        )
+    return lambda syllable: (
+        syllable.stress in stress
+        and vowel(syllable.nucleus)
+        and onset(syllable.onset)
+        and coda(syllable.coda)
+    )
 
+
+def _compile_vowel_predicate(
+    matcher: Optional[Callable[[str], Optional[re.Match[str]]]], accepted: FrozenSet[str]
+) -> Callable[[str], bool]:
+    # Known nuclei and literal options are decided by ``accepted``; other
+    # nuclei fall back to the glob regex, if the pattern has one.
+    if matcher is None:
+        return accepted.__contains__
+    known = _KNOWN_NUCLEI
+
+    def predicate(vowel: str) -> bool:
+        if vowel in accepted:
+            return True
+        if vowel in known:
+            return False
+        return matcher(vowel) is not None
+
+    return predicate
+
+
+def _match_token_pattern(pattern: Sequence[_TokenPattern], cluster: Sequence[str]) -> bool:
+    stars, allowed = _token_slots(pattern)
+    return _match_slots(stars, allowed, cluster)
+
+
+def _token_slots(
+    pattern: Sequence[_TokenPattern],
+) -> Tuple[Tuple[bool, ...], Tuple[Optional[FrozenSet[str]], ...]]:
+    """Split ``pattern`` into star flags and the tokens allowed at each position.
+
+    ``None`` means any token is allowed (``?`` or ``*``).
+    """
+
+    for part in pattern:
+        if part.kind not in {"star", "any", "literal", "set"}:
+            raise ValueError(f"Unknown token pattern kind '{part.kind}'")
+    # Adjacent stars match exactly what one star does; collapse them so the
+    # matcher never backtracks through redundant positions.
+    parts = [
+        part
+        for index, part in enumerate(pattern)
+        if not (part.kind == "star" and index and pattern[index - 1].kind == "star")
+    ]
+    stars = tuple(part.kind == "star" for part in parts)
+    allowed = tuple(
+        frozenset(part.values) if part.kind in {"literal", "set"} else None for part in parts
+    )
+    return stars, allowed
+
+
+def _match_slots(
+    stars: Tuple[bool, ...], allowed: Tuple[Optional[FrozenSet[str]], ...], cluster: Sequence[str]
+) -> bool:
+    # Iterative wildcard matching: on a mismatch, retry from the most recent
+    # star with it consuming one more token. Linear in practice, no recursion.
+    size = len(stars)
+    pi = ci = 0
+    star_pi = -1
+    star_ci = 0
+    while ci < len(cluster):
+        if pi < size and stars[pi]:
+            star_pi = pi
+            star_ci = ci
+            pi += 1
+        elif pi < size and (allowed[pi] is None or cluster[ci] in allowed[pi]):
+            pi += 1
+            ci += 1
+        elif star_pi >= 0:
+            pi = star_pi + 1
+            star_ci += 1
+            ci = star_ci
+        else:
+            return False
+    while pi < size and stars[pi]:
+        pi += 1
+    return pi == size
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import sqlite3
+
 import _bootstrap  # noqa: F401
 import pytest
 
 from poetry_assistant.database import PoetryDatabase
 
 
-@pytest.fixture()
-def sample_db(tmp_path):
-    db_path = tmp_path / "poetry.db"
+@pytest.fixture(scope="session")
+def sample_db_template(tmp_path_factory):
+    """Build the sample database once; ``sample_db`` hands out copies."""
+
+    db_path = tmp_path_factory.mktemp("template") / "poetry.db"
     db = PoetryDatabase(db_path)
     db.initialize()
 
@@ -47,13 +51,35 @@ def sample_db(tmp_path):
         },
     }
 
+    # One transaction for the pronunciations and one for the definitions.
+    word_ids = db.bulk_ingest(
+        (word, pronunciation.split())
+        for word, details in data.items()
+        for pronunciation in details["pronunciations"]
+    )
     for word, details in data.items():
-        word_id = db.add_word(word)
-        for pronunciation in details["pronunciations"]:
-            db.add_pronunciation(word_id, pronunciation.split())
         for part, definition, synonyms in details.get("definitions", []):
-            db.add_definition(word_id, part, definition, synonyms=synonyms)
+            db.stage_definition(word_ids[word], part, definition, synonyms=synonyms)
+    db.flush_definitions()
+
+    db.close()
+    return db_path
+
 
+@pytest.fixture()
+def sample_db(tmp_path, sample_db_template):
+    db_path = tmp_path / "poetry.db"
+    # The SQLite backup API copies the populated pages in one pass instead of
+    # replaying the schema build and every insert for each test.
+    source = sqlite3.connect(sample_db_template)
+    target = sqlite3.connect(db_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+    db = PoetryDatabase(db_path)
+    db.initialize()
     try:
         yield db
     finally:
@@ -1,7 +1,8 @@
 import _bootstrap  # noqa: F401
 
+from poetry_assistant import ingest
 from poetry_assistant.database import PoetryDatabase
-from poetry_assistant.ingest import build_database, ingest_cmudict, parse_cmudict
+from poetry_assistant.ingest import build_database, ingest_cmudict, ingest_wordnet, parse_cmudict
 
 
 def test_build_database_creates_nested_directory(tmp_path):
@@ -42,3 +43,222 @@ def test_cmudict_ingest_tolerates_latin1_bytes(tmp_path):
         assert pronunciations
     finally:
         db.close()
+
+
+def test_bulk_ingest_groups_variant_pronunciations(tmp_path):
+    db = PoetryDatabase(tmp_path / "poetry.db")
+    db.initialize()
+    try:
+        word_ids = db.bulk_ingest(
+            [
+                ("READ", ["R", "IY1", "D"]),
+                ("read", ["R", "EH1", "D"]),
+                ("cat", ["K", "AE1", "T"]),
+            ]
+        )
+        assert set(word_ids) == {"read", "cat"}
+        rows = db.pronunciations_for_word("read")
+        assert {row["pronunciation"] for row in rows} == {"R IY1 D", "R EH1 D"}
+        assert {int(row["word_id"]) for row in rows} == {word_ids["read"]}
+    finally:
+        db.close()
+
+
+def test_parse_cmudict_strips_variants_and_skips_symbols(tmp_path):
+    cmu_dict = tmp_path / "cmudict.sample"
+    cmu_dict.write_text(
+        "READ  R IY1 D\nREAD(1)  R EH1 D\n'BOUT  B AW1 T\n!EXCLAMATION-POINT  EH2 K S\n"
+    )
+
+    assert list(parse_cmudict(cmu_dict)) == [
+        ("read", ["R", "IY1", "D"]),
+        ("read", ["R", "EH1", "D"]),
+        ("'bout", ["B", "AW1", "T"]),
+    ]
+
+
+class _FakeLemma:
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class _FakeSynset:
+    def __init__(self, name, pos, definition, lemmas):
+        self._name = name
+        self._pos = pos
+        self._definition = definition
+        self._lemmas = [_FakeLemma(lemma) for lemma in lemmas]
+
+    def name(self):
+        return self._name
+
+    def pos(self):
+        return self._pos
+
+    def definition(self):
+        return self._definition
+
+    def examples(self):
+        return []
+
+    def lemmas(self):
+        return self._lemmas
+
+
+class _FakeWordNet:
+    def __init__(self):
+        feline = _FakeSynset("cat.n.01", "n", "a small feline", ["cat", "house_cat"])
+        self._synsets = {"cat": [feline], "kitty": [feline]}
+
+    def synsets(self, word):
+        return self._synsets.get(word, [])
+
+
+def test_ingest_wordnet_batches_definitions(monkeypatch, tmp_path):
+    monkeypatch.setattr(ingest, "wn", _FakeWordNet())
+    monkeypatch.setattr(ingest, "ensure_nltk_data", lambda: None)
+    monkeypatch.setattr(ingest, "DEFINITION_BATCH_SIZE", 1)
+
+    db = PoetryDatabase(tmp_path / "poetry.db")
+    db.initialize()
+    try:
+        word_ids = db.bulk_ingest([("cat", ["K", "AE1", "T"]), ("kitty", ["K", "IH1", "T", "IY0"])])
+        ingest_wordnet(db, word_ids)
+        definitions = db.load_definitions(list(word_ids.values()))
+        cat_defs = definitions[word_ids["cat"]]
+        kitty_defs = definitions[word_ids["kitty"]]
+        assert [d.part_of_speech for d in cat_defs] == ["noun"]
+        assert cat_defs[0].synonyms == ["house cat"]
+        assert kitty_defs[0].synonyms == ["cat", "house cat"]
+    finally:
+        db.close()
+
+
+def test_initialize_indexes_definitions_from_unversioned_database(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    db = PoetryDatabase(db_path)
+    db.initialize()
+    word_id = db.add_word("cat")
+    db.add_pronunciation(word_id, ["K", "AE1", "T"])
+    db.add_definition(word_id, "noun", "a small feline")
+    # Simulate a database written before the full-text indexes existed.
+    with db.conn:
+        db.conn.execute("INSERT INTO definitions_fts(definitions_fts) VALUES ('delete-all')")
+        db.conn.execute("PRAGMA user_version = 0")
+    db.close()
+
+    db = PoetryDatabase(db_path)
+    db.initialize()
+    try:
+        rows = list(db.iter_pronunciations(definition_query="feline"))
+        assert [row["word"] for row in rows] == ["cat"]
+    finally:
+        db.close()
+
+
+def test_initialize_adds_perfect_rhyme_keys_to_version_1_database(tmp_path):
+    db_path = tmp_path / "v1.db"
+    db = PoetryDatabase(db_path)
+    db.initialize()
+    db.add_pronunciation(db.add_word("station"), ["S", "T", "EY1", "SH", "AH0", "N"])
+    # Simulate a version 1 file, written before perfect rhyme keys were stored.
+    with db.conn:
+        db.conn.execute("DROP INDEX idx_pronunciations_perfect_rhyme")
+        db.conn.execute("ALTER TABLE pronunciations DROP COLUMN perfect_rhyme_key")
+        db.conn.execute("PRAGMA user_version = 1")
+    db.close()
+
+    db = PoetryDatabase(db_path)
+    db.initialize()
+    try:
+        rows = db.perfect_rhymes_by_key("EY1 SH AH0 N")
+        assert [row["word"] for row in rows] == ["station"]
+    finally:
+        db.close()
+
+
+def test_initialize_rebuilds_rhyme_indexes_from_version_2_database(tmp_path):
+    db_path = tmp_path / "v2.db"
+    db = PoetryDatabase(db_path)
+    db.initialize()
+    # Simulate a version 2 file, whose rhyme-key index lacks the syllable count.
+    with db.conn:
+        db.conn.execute("DROP INDEX idx_pronunciations_rhyme1")
+        db.conn.execute("CREATE INDEX idx_pronunciations_rhyme1 ON pronunciations(rhyme_key_1)")
+        db.conn.execute("PRAGMA user_version = 2")
+    db.close()
+
+    db = PoetryDatabase(db_path)
+    db.initialize()
+    try:
+        columns = [row["name"] for row in db.conn.execute("PRAGMA index_info(idx_pronunciations_rhyme1)")]
+        assert columns == ["rhyme_key_1", "syllable_count"]
+    finally:
+        db.close()
+
+
+def test_ingest_cmudict_parallel_matches_serial(monkeypatch, tmp_path):
+    cmu_dict = tmp_path / "cmudict.sample"
+    cmu_dict.write_text("CAT  K AE1 T\nBAT  B AE1 T\nREAD  R IY1 D\nREAD(1)  R EH1 D\n")
+    monkeypatch.setattr(ingest, "CMU_CHUNK_SIZE", 1)
+
+    results = []
+    for workers in (1, 2):
+        db = PoetryDatabase(tmp_path / f"poetry-{workers}.db")
+        db.initialize()
+        try:
+            word_ids = ingest_cmudict(db, cmu_dict, workers=workers)
+            rows = db.conn.execute(
+                "SELECT words.word, pronunciation, rhyme_key_1 FROM pronunciations "
+                "JOIN words ON words.id = pronunciations.word_id ORDER BY pronunciations.id"
+            )
+            results.append((word_ids, [tuple(row) for row in rows]))
+        finally:
+            db.close()
+
+    assert results[0] == results[1]
+    assert len(results[0][1]) == 4
+
+
+def test_small_bulk_ingest_keeps_indexes(sample_db):
+    statements = []
+    sample_db.conn.set_trace_callback(statements.append)
+    try:
+        word_ids = sample_db.bulk_ingest([("hat", ["HH", "AE1", "T"]), ("Cat", ["K", "AE1", "T"])])
+    finally:
+        sample_db.conn.set_trace_callback(None)
+
+    assert not [statement for statement in statements if "DROP INDEX" in statement]
+    assert word_ids["cat"] == sample_db.pronunciations_for_word("cat")[0]["word_id"]
+    assert [row["word"] for row in sample_db.rhymes_by_key("AE1 T", 1)] == ["bat", "cat", "hat"]
+
+
+def test_definition_ids_are_not_reused_after_delete(sample_db):
+    word_id = sample_db.add_word("cat")
+    sample_db.add_definition(word_id, "noun", "a temporary gloss")
+    deleted_id = sample_db.conn.execute("SELECT MAX(id) FROM definitions").fetchone()[0]
+    with sample_db.conn:
+        sample_db.conn.execute("DELETE FROM definitions WHERE id = ?", (deleted_id,))
+
+    sample_db.add_definition(word_id, "noun", "a lasting gloss", synonyms=["kitty"])
+    row = sample_db.conn.execute(
+        "SELECT id FROM definitions WHERE definition = 'a lasting gloss'"
+    ).fetchone()
+    assert row["id"] > deleted_id
+    definitions = sample_db.load_definitions([word_id])[word_id]
+    assert [d.synonyms for d in definitions if d.definition == "a lasting gloss"] == [["kitty"]]
+
+
+def test_bulk_ingest_works_while_another_connection_is_open(sample_db):
+    reader = PoetryDatabase(sample_db.path)
+    try:
+        assert reader.pronunciations_for_word("cat")
+        sample_db.bulk_ingest([("hat", ["HH", "AE1", "T"])])
+        assert reader.pronunciations_for_word("hat")
+        mode = sample_db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+    finally:
+        reader.close()
@@ -2,7 +2,16 @@ import pytest
 
 import _bootstrap  # noqa: F401
 
-from poetry_assistant.phonetics import Pronunciation, levenshtein_distance, similarity
+from poetry_assistant import phonetics
+from poetry_assistant.phonetics import (
+    Pronunciation,
+    distance_from,
+    levenshtein_distance,
+    pronunciation_from_text,
+    rhyme_key_from_text,
+    similarity,
+    tokens,
+)
 
 
 def test_pronunciation_features():
@@ -12,6 +21,33 @@ def test_pronunciation_features():
     assert pron.rhyme_key(1) == "AE1 T"
     assert pron.terminal_vowels() == "AE1"
     assert pron.terminal_consonants() == "T"
+    assert Pronunciation(("B", "AE1", "T", "AH0", "L")).vowel_indices == (1, 3)
+
+
+def test_pronunciation_from_text_is_shared():
+    pron = pronunciation_from_text("K AE1 T")
+    assert pron is pronunciation_from_text("K AE1 T")
+    assert pron == Pronunciation(("K", "AE1", "T"))
+    assert rhyme_key_from_text("P AH1 S T EY2 SH AH0 N", 2) == "EY2 SH AH0 N"
+
+
+def test_tokens_pool_only_known_phonemes():
+    pool_size = len(phonetics._PHONEME_POOL)
+    first = tokens("".join(["AE", "1"]) + " QQ7")
+    second = tokens("AE1 QQ7")
+    assert first[0] is second[0]
+    assert first == ["AE1", "QQ7"]
+    assert len(phonetics._PHONEME_POOL) == pool_size
+
+
+def test_unknown_phonemes_do_not_grow_stress_table():
+    table_size = len(phonetics._PHONEME_STRESS)
+    assert phonetics.phoneme_stress("XX9") == ""
+    assert phonetics.phoneme_stress("AE") == "0"
+    assert Pronunciation(("QQ", "AE1", "T")).syllable_count == 1
+    assert Pronunciation(("K", "AE3", "T")).stress_pattern == "3"
+    assert Pronunciation(("K", "AE1", "T", "AH3")).perfect_rhyme_key() == "AE1 T AH3"
+    assert len(phonetics._PHONEME_STRESS) == table_size
 
 
 def test_perfect_rhyme_key_uses_last_primary_stress():
@@ -22,6 +58,15 @@ def test_perfect_rhyme_key_uses_last_primary_stress():
 def test_perfect_rhyme_key_requires_primary_stress():
     pron = Pronunciation(("B", "AH0", "T", "ER0", "F", "L", "AY2"))
     assert pron.perfect_rhyme_key() is None
+    assert pron.perfect_rhyme_key() is None
+
+
+def test_rhyme_keys_are_memoized_per_instance():
+    pron = Pronunciation(("P", "AH1", "S", "T", "EY2", "SH", "AH0", "N"))
+    assert pron.rhyme_key(2) is pron.rhyme_key(2)
+    assert pron.rhyme_key(9) is None and pron.rhyme_key(9) is None
+    assert pron.perfect_rhyme_key() is pron.perfect_rhyme_key()
+    assert pron == Pronunciation(pron.phonemes)
 
 
 def test_similarity_metrics():
@@ -30,3 +75,48 @@ def test_similarity_metrics():
     assert levenshtein_distance(left, right) == 1
     assert similarity(left, right) == pytest.approx(0.5)
 
+
+def test_levenshtein_handles_long_sequences():
+    left = ["AH0", "T"] * 40
+    right = ["AH0", "D"] * 40
+    assert levenshtein_distance(left, right) == 40
+    assert levenshtein_distance(left, left[:-3]) == 3
+
+
+def test_bounded_distance_stops_past_threshold():
+    left = ["K", "AE1", "T", "S"]
+    right = ["D", "AO1", "G"]
+    assert levenshtein_distance(left, right) == 4
+    assert levenshtein_distance(left, right, max_distance=2) == 3
+    assert levenshtein_distance(left, right, max_distance=4) == 4
+    assert similarity(left, right, min_similarity=0.5) < 0.5
+    assert similarity(["AE1", "T"], ["AE1", "D"], min_similarity=0.5) == pytest.approx(0.5)
+
+
+def test_rapidfuzz_cutoff_matches_pure_python_kernels():
+    rapid_levenshtein = pytest.importorskip("rapidfuzz.distance").Levenshtein
+    pairs = [
+        (["K", "AE1", "T"], ["K", "AE1", "T", "S"]),
+        (["D", "AO1", "G"], ["K", "AE1", "T", "S"]),
+        (["AH0", "T"] * 5, ["AH0", "D"] * 5),
+        (["S", "P", "AY1", "D", "ER0"], ["S", "P", "AY1", "D", "ER0"]),
+    ]
+    for left, right in pairs:
+        for max_distance in (None, 0, 1, 2, 3, 5):
+            expected = phonetics._myers_distance(left, right, max_distance)
+            assert phonetics._dp_distance(left, right, max_distance) == expected
+            actual = rapid_levenshtein.distance(left, right, score_cutoff=max_distance)
+            assert actual == expected
+            assert levenshtein_distance(left, right, max_distance) == expected
+    # Past the bound every kernel reports ``max_distance + 1``.
+    left, right = ["D", "AO1", "G"], ["K", "AE1", "T", "S"]
+    assert levenshtein_distance(left, right, max_distance=1) == 2
+
+
+def test_distance_from_matches_levenshtein_distance():
+    pattern = ["K", "AE1", "T", "S"]
+    distance = distance_from(pattern)
+    for other in (["D", "AO1", "G"], ["K", "AE1", "T"], [], pattern):
+        assert distance(other) == levenshtein_distance(pattern, other)
+    assert distance(["D", "AO1", "G"], 2) == 3
+    assert similarity(pattern, ["K", "AE1", "T"], distance=distance) == pytest.approx(0.75)
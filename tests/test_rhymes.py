@@ -1,6 +1,7 @@
 import _bootstrap  # noqa: F401
 
 from poetry_assistant.rhymes import RhymeAssistant
+from poetry_assistant.search import SearchOptions
 
 
 def test_rhyme_assistant(sample_db):
@@ -13,6 +14,15 @@ def test_rhyme_assistant(sample_db):
     assert any(match.word == "bat" for match in results[1])
 
 
+def test_suggestion_definitions_do_not_leak_into_cached_searches(sample_db):
+    assistant = RhymeAssistant(sample_db)
+    results = assistant.suggest_rhymes("The curious cat", max_syllables=1, max_results=5)
+    assert any(match.definitions for match in results[1])
+
+    options = SearchOptions(pattern="AE1 T", limit=5, include_definitions=False)
+    assert all(not result.definitions for result in assistant.search.search(options))
+
+
 def test_perfect_rhyme(sample_db):
     assistant = RhymeAssistant(sample_db)
     suggestions = assistant.perfect_rhymes("amazing", max_results=5)
@@ -34,3 +44,23 @@ def test_perfect_rhyme_unbounded_results(sample_db):
     suggestions = assistant.perfect_rhymes("amazing", max_results=None)
     assert suggestions["AH0 M EY1 Z IH0 NG"]
 
+
+def test_perfect_rhymes_are_cached_until_the_database_changes(sample_db):
+    assistant = RhymeAssistant(sample_db)
+    first = assistant.perfect_rhymes("amazing", max_results=None)
+    first["AH0 M EY1 Z IH0 NG"][0].word = "MUTATED"
+    first["AH0 M EY1 Z IH0 NG"].clear()
+    matches = assistant.perfect_rhymes("amazing", max_results=None)["AH0 M EY1 Z IH0 NG"]
+    assert "blazing" in [match.word for match in matches]
+    assert "MUTATED" not in [match.word for match in matches]
+
+    sample_db.add_pronunciation(sample_db.add_word("grazing"), "G R EY1 Z IH0 NG")
+    matches = assistant.perfect_rhymes("amazing", max_results=None)["AH0 M EY1 Z IH0 NG"]
+    assert "grazing" in [match.word for match in matches]
+
+
+def test_line_pronunciations_use_last_known_word(sample_db):
+    assistant = RhymeAssistant(sample_db)
+    pronunciations = assistant._line_pronunciations("A Spider's web holds the CAT, zzyzx!")
+    assert [word for word, _ in pronunciations] == ["cat"]
+    assert pronunciations[0][1].text == "K AE1 T"
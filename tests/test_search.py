@@ -1,5 +1,6 @@
 import _bootstrap  # noqa: F401
 
+from poetry_assistant.database import PoetryDatabase
 from poetry_assistant.search import SearchEngine, SearchOptions
 
 
@@ -13,6 +14,16 @@ def test_exact_rhyme_search(sample_db):
     assert results[0].definitions
 
 
+def test_search_can_skip_definitions(sample_db):
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern="AE1 T", limit=10, include_definitions=False)
+    results = engine.search(options)
+    assert results
+    assert all(not result.definitions for result in results)
+    engine.attach_definitions(results)
+    assert any(result.definitions for result in results)
+
+
 def test_near_rhyme_distance(sample_db):
     engine = SearchEngine(sample_db)
     options = SearchOptions(pattern="AE1 T", pattern_type="rhyme", syllables=1, max_distance=1, limit=10)
@@ -28,6 +39,25 @@ def test_stress_filter(sample_db):
     assert all(result.stress_pattern.startswith("1") for result in results)
 
 
+def test_stress_filter_sees_new_stress_patterns(sample_db):
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern_type="phonemes", stress_pattern="2*", limit=None)
+    assert engine.search(options) == []
+
+    sample_db.add_pronunciation(sample_db.add_word("rosette"), "R OW2 Z EH1 T")
+    assert [result.word for result in engine.search(options)] == ["rosette"]
+
+
+def test_star_patterns_accept_every_row(sample_db):
+    engine = SearchEngine(sample_db)
+    unfiltered = engine.search(SearchOptions(pattern_type="phonemes", limit=None))
+    starred = engine.search(
+        SearchOptions(pattern="**", pattern_type="phonemes", stress_pattern="*", limit=None)
+    )
+    assert [result.word for result in starred] == [result.word for result in unfiltered]
+    assert all(result.similarity == 1.0 for result in starred)
+
+
 def test_rhyme_search_with_large_syllable_request(sample_db):
     engine = SearchEngine(sample_db)
     options = SearchOptions(pattern="AE1 T", pattern_type="rhyme", syllables=5, limit=10)
@@ -126,3 +156,97 @@ def test_limit_none_returns_all_results(sample_db):
     results = engine.search(options)
     total = sum(1 for _ in sample_db.iter_pronunciations())
     assert len(results) == total
+
+
+def test_lexical_filters_match_substrings(sample_db):
+    engine = SearchEngine(sample_db)
+    by_definition = engine.search(SearchOptions(pattern_type="rhyme", definition_query="DOMESTIC"))
+    assert [result.word for result in by_definition] == ["cat"]
+
+    by_synonym = engine.search(SearchOptions(pattern_type="rhyme", synonym_query="roptera"))
+    assert [result.word for result in by_synonym] == ["bat"]
+
+    by_pos = engine.search(SearchOptions(pattern_type="rhyme", part_of_speech="adjective", limit=None))
+    assert {result.word for result in by_pos} == {"bad", "amazing", "blazing"}
+
+
+def test_lexical_filters_without_fts_tables(sample_db):
+    sample_db._fts_available = False
+    engine = SearchEngine(sample_db)
+    results = engine.search(SearchOptions(pattern_type="rhyme", definition_query="mammal"))
+    assert [result.word for result in results] == ["bat"]
+    results = engine.search(SearchOptions(pattern_type="rhyme", synonym_query="flam"))
+    assert [result.word for result in results] == ["blazing"]
+
+
+def test_rhymes_by_key_uses_stored_keys(sample_db):
+    rows = sample_db.rhymes_by_key("AE1 T", 1)
+    assert [row["word"] for row in rows] == ["bat", "cat"]
+
+    limited = sample_db.rhymes_by_key("AE1 T", 1, limit=1, exclude_word_ids=[rows[0]["word_id"]])
+    assert [row["word"] for row in limited] == ["cat"]
+
+    two_syllables = sample_db.rhymes_by_key("EY1 Z IH0 NG", 2, part_of_speech="adjective")
+    assert [row["word"] for row in two_syllables] == ["amazing", "blazing"]
+
+
+def test_near_phoneme_search_uses_bigram_candidates(sample_db):
+    candidates = sample_db.sequences_by_qgrams("pronunciation", ["S", "P", "AY1", "D", "ER0"], 3)
+    assert candidates == ["S P AY1 D ER0"]
+
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern="S P AY1 D ER1", pattern_type="phonemes", max_distance=1)
+    results = engine.search(options)
+    assert [result.word for result in results] == ["spider"]
+    assert results[0].similarity == 0.8
+
+
+def test_search_results_are_cached_until_the_database_changes(sample_db):
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern="AE1 T", limit=None)
+    first = [result.word for result in engine.search(options)]
+    assert [result.word for result in engine.search(options)] == first
+
+    sample_db.add_pronunciation(sample_db.add_word("hat"), "HH AE1 T")
+    assert "hat" in [result.word for result in engine.search(options)]
+
+
+def test_cached_results_are_not_shared_with_callers(sample_db):
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern="AE1 T", limit=None)
+    results = engine.search(options)
+    results[0].word = "MUTATED"
+    results[0].definitions.clear()
+    again = engine.search(options)
+    assert "MUTATED" not in [result.word for result in again]
+    assert all(result.definitions for result in again)
+
+    batched = engine.exact_rhyme_matches([(1, "AE1 T")], limit=None)
+    batched[(1, "AE1 T")][0].word = "MUTATED"
+    again = engine.exact_rhyme_matches([(1, "AE1 T")], limit=None)
+    assert "MUTATED" not in [result.word for result in again[(1, "AE1 T")]]
+
+
+def test_wildcard_search_matches_distinct_sequences(sample_db):
+    assert sample_db.distinct_sequences("rhyme_key_1").count("AE1 T") == 1
+
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern="AE1 *", pattern_type="rhyme", limit=None)
+    words = [result.word for result in engine.search(options)]
+    assert {"bad", "bat", "cat"}.issubset(words)
+
+
+def test_caches_see_writes_from_other_connections(sample_db):
+    engine = SearchEngine(sample_db)
+    options = SearchOptions(pattern="AE1 *", pattern_type="rhyme", limit=None)
+    assert "had" not in [result.word for result in engine.search(options)]
+
+    writer = PoetryDatabase(sample_db.path)
+    try:
+        writer.add_pronunciation(writer.add_word("had"), "HH AE1 D")
+    finally:
+        writer.close()
+
+    assert "had" in [result.word for result in engine.search(options)]
+    fresh = SearchOptions(pattern="AE1 *", pattern_type="rhyme", limit=10)
+    assert "had" in [result.word for result in engine.search(fresh)]
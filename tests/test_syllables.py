@@ -1,12 +1,15 @@
 import _bootstrap  # noqa: F401
 
 from poetry_assistant.syllables import (
+    CompiledSyllablePattern,
+    SyllableIndex,
     WildcardSequence,
     WildcardSyllable,
     find_syllable_matches,
     matches_syllable_pattern,
     parse_syllable_pattern,
     syllabify,
+    syllabify_many,
 )
 
 
@@ -106,3 +109,80 @@ def test_double_wildcard_allows_zero_length_match():
 
     zero_only = find_syllable_matches(syllables, parse_syllable_pattern("**"), contains=True)
     assert (1, 1) in zero_only
+
+
+def test_choice_and_fixed_length_components():
+    choice = parse_syllable_pattern("([B D G])-AW[1]/N")
+    assert matches_syllable_pattern(syllabify("G AW1 N"), choice)
+    assert not matches_syllable_pattern(syllabify("B R AW1 N"), choice)
+
+    fixed = parse_syllable_pattern("(? [R L])-AW[1]/N")
+    assert matches_syllable_pattern(syllabify("B R AW1 N"), fixed)
+    assert matches_syllable_pattern(syllabify("K L AW1 N"), fixed)
+    assert not matches_syllable_pattern(syllabify("G AW1 N"), fixed)
+
+
+def test_syllable_index_narrows_candidates_by_nucleus():
+    index = SyllableIndex(["S P AY1 D ER0", "AH0 B AW1 T", "B R AW1 N"])
+    assert index.candidates(parse_syllable_pattern("*-AW[1]/*")) == {"AH0 B AW1 T", "B R AW1 N"}
+    assert index.candidates(parse_syllable_pattern("*-AY[1] *-AW")) == set()
+    assert index.candidates(parse_syllable_pattern("*-ER[1]")) == set()
+    assert index.candidates(parse_syllable_pattern("*-ER[1]"), ignore_stress=True) == {"S P AY1 D ER0"}
+    assert index.candidates(parse_syllable_pattern("* **")) is None
+
+
+def test_syllabify_many_matches_syllabify():
+    texts = ["S P AY1 D ER0", "AH0 B AW1 T", "S P AY1 D ER0"]
+    assert [list(s) for s in syllabify_many(texts)] == [syllabify(t.split()) for t in texts]
+
+
+def test_parse_syllable_pattern_returns_fresh_list_of_shared_elements():
+    first = parse_syllable_pattern("(S P)-AY[1] *-ER")
+    second = parse_syllable_pattern("(S P)-AY[1] *-ER")
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_syllable_patterns_are_hashable():
+    pattern = parse_syllable_pattern("(S P)-AY[1|2] *-ER")
+    assert pattern[0].stress == frozenset({"1", "2"})
+    assert len({*pattern, *parse_syllable_pattern("(S P)-AY[1|2] *-ER")}) == 2
+
+
+def test_equal_pattern_elements_are_shared_across_patterns():
+    first = parse_syllable_pattern("*-AE[1]/T")
+    second = parse_syllable_pattern("*-EH[1]/* *-AE[P]/T")
+    assert second[1] is first[0]
+
+
+def test_compiled_pattern_reuses_across_words():
+    matcher = CompiledSyllablePattern(parse_syllable_pattern("*-AW[1]/*"))
+    words = ["AH0 B AW1 T", "B R AW1 N", "S P AY1 D ER0"]
+    for text in words:
+        syllables = syllabify(text)
+        expected = find_syllable_matches(syllables, parse_syllable_pattern("*-AW[1]/*"), contains=True)
+        assert matcher.find(syllables, contains=True) == expected
+        assert matcher.first(syllables, contains=True) == (expected[0] if expected else None)
+    assert matcher.matches(syllabify("B R AW1 N"))
+    assert not matcher.matches(syllabify("AH0 B AW1 T"))
+
+
+def test_compiled_pattern_whole_word_match():
+    matcher = CompiledSyllablePattern(parse_syllable_pattern("* *-AH[0]/*"))
+    assert matcher.find(syllabify("AH0 B AW1 T")) == []
+    assert matcher.find(syllabify("B AE1 T AH0 L")) == [(0, 2)]
+    assert matcher.first(syllabify("B AE1 T AH0 L")) == (0, 2)
+    assert matcher.matches(syllabify("B AE1 T AH0 L")) is True
+    assert matcher.matches(syllabify("B AE1 T AH0 L AH0")) is False
+
+
+def test_whole_word_matcher_agrees_with_reachability_table():
+    patterns = ["* *-AH[0]/*", "*-AE[1]/T", "[B K]-AE/* *", "* * *", "*-(AH|ER)[0]/[L R *]"]
+    words = ["K AE1 T", "B AE1 T AH0 L", "AH0 B AW1 T", "S P AY1 D ER0", "B L EY1 Z IH0 NG", ""]
+    for pattern in patterns:
+        matcher = CompiledSyllablePattern(parse_syllable_pattern(pattern))
+        assert matcher._whole is not None
+        for text in words:
+            syllables = syllabify(text)
+            assert matcher._whole(syllables) == any(matcher._ends(syllables, False)), (pattern, text)
+    assert CompiledSyllablePattern(parse_syllable_pattern("** *-AH[0]/*"))._whole is None